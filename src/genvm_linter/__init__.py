@@ -4,8 +4,27 @@ from importlib.metadata import version as _get_version
 
 __version__ = _get_version("genvm-linter")
 
-# Backwards-compatible exports for studio integration
-from .linter import GenVMLinter
-from .rules import Severity, ValidationResult
+# Backwards-compatible exports for studio integration, resolved lazily (PEP 562)
+# so that importing the package for __version__ or a submodule stays cheap.
+_LAZY_EXPORTS = {
+    "GenVMLinter": ".linter",
+    "Severity": ".rules",
+    "ValidationResult": ".rules",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = ["GenVMLinter", "Severity", "ValidationResult", "__version__"]
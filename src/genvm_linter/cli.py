@@ -1,13 +1,18 @@
 """CLI entry point for genvm-linter."""
 
+import hashlib
 import json
+import os
 import sys
+import time
 from pathlib import Path
+from typing import Callable, Iterator
 
 import click
 
 from . import __version__
-from .lint import lint_contract, _ERROR_CODES
+from .lint import LintResult, lint_contract, _ERROR_CODES
+from .lint.cache import lint_contract_cached
 from .output import (
     format_human_lint,
     format_human_schema,
@@ -19,23 +24,54 @@ from .validate import validate_contract
 from .validate.artifacts import (
     clean_cache,
     download_artifacts,
+    get_cache_dir,
     get_latest_version,
     list_available_versions,
     list_cached_versions,
 )
-from .validate.sdk_loader import extract_sdk_paths, parse_contract_header
+from .validate.sdk_loader import SdkContext, extract_sdk_paths, parse_contract_header
 
 # Subcommand names for detecting legacy mode
-SUBCOMMANDS = {"check", "lint", "validate", "schema", "download", "stubs", "setup", "cache", "typecheck"}
+SUBCOMMANDS = frozenset(
+    {"check", "lint", "validate", "schema", "download", "stubs", "setup", "cache", "typecheck"}
+)
+
+
+# Redraw download progress at most this often (or every this many bytes)
+_PROGRESS_INTERVAL = 0.05
+_PROGRESS_BYTES = 256 * 1024
 
 
-def print_progress(downloaded: int, total: int):
-    """Print download progress."""
-    if total > 0:
+def make_progress(prefix: str = "Downloading: ") -> Callable[[int, int], None]:
+    """Build a throttled download progress printer.
+
+    The download loop reports every chunk; redrawing the line each time
+    floods the terminal, so updates are limited to ~20/s or every 256 KiB.
+    The final update is always printed.
+    """
+    last_time = 0.0
+    last_bytes = 0
+
+    def progress(downloaded: int, total: int):
+        nonlocal last_time, last_bytes
+        if total <= 0:
+            return
+        now = time.monotonic()
+        if (
+            downloaded < total
+            and downloaded >= last_bytes
+            and downloaded - last_bytes < _PROGRESS_BYTES
+            and now - last_time < _PROGRESS_INTERVAL
+        ):
+            return
+        last_time = now
+        last_bytes = downloaded
         percent = min(100, downloaded * 100 // total)
         mb_down = downloaded / (1024 * 1024)
         mb_total = total / (1024 * 1024)
-        click.echo(f"\rDownloading: {mb_down:.1f}/{mb_total:.1f} MB ({percent}%)", nl=False)
+        click.echo(f"\r{prefix}{mb_down:.1f}/{mb_total:.1f} MB ({percent}%)", nl=False)
+
+    return progress
 
 
 def _is_legacy_invocation() -> bool:
@@ -44,17 +80,13 @@ def _is_legacy_invocation() -> bool:
     Legacy: python -m genvm_linter.cli <file> --format json
     Modern: genvm-lint check <file> --json
     """
-    if len(sys.argv) < 2:
-        return False
-
-    first_arg = sys.argv[1]
-
-    # If first arg is a subcommand or starts with -, it's modern mode
-    if first_arg in SUBCOMMANDS or first_arg.startswith("-"):
+    argv = sys.argv
+    if len(argv) < 2:
         return False
 
-    # If first arg looks like a file path, it's legacy mode
-    return True
+    # A subcommand or option first means modern mode; anything else is a file path
+    first_arg = argv[1]
+    return first_arg not in SUBCOMMANDS and not first_arg.startswith("-")
 
 
 def _run_legacy_lint():
@@ -84,13 +116,19 @@ def _run_legacy_lint():
 
     result = lint_contract(contract_path)
 
-    # Filter by severity if specified
-    if args.severity == "error":
-        result.warnings = [w for w in result.warnings if w.get("code", "").startswith("E") or w.get("code") in _ERROR_CODES]
-
-    # Filter excluded rules
-    if args.exclude_rules:
-        result.warnings = [w for w in result.warnings if w.get("code") not in args.exclude_rules]
+    # Filter by severity and excluded rules in a single pass
+    errors_only = args.severity == "error"
+    excluded = frozenset(args.exclude_rules)
+    if errors_only or excluded:
+        kept = []
+        for w in result.warnings:
+            code = w.get("code", "")
+            if code in excluded:
+                continue
+            if errors_only and not (code.startswith("E") or code in _ERROR_CODES):
+                continue
+            kept.append(w)
+        result.warnings = kept
 
     if args.output_format == "json":
         print(format_vscode_json(result))
@@ -102,67 +140,257 @@ def _run_legacy_lint():
 
 @click.group()
 @click.version_option(__version__, prog_name="genvm-lint")
-def main():
+@click.pass_context
+def main(ctx):
     """GenLayer contract linter and validator."""
-    pass
+    # One SDK context per invocation so artifacts are resolved at most once
+    if ctx.obj is None:
+        ctx.obj = SdkContext()
+
+
+# Directories never searched for contracts, besides hidden ones (.git, .venv, ...)
+_SKIPPED_DIRS = frozenset({"__pycache__", "node_modules"})
+
+
+def _iter_py_files(directory: Path) -> Iterator[Path]:
+    """Yield the .py files beneath directory, not following directory symlinks.
+
+    Hidden directories, __pycache__ and node_modules are skipped, as pyright
+    excludes them by default. Uses the file types from the directory listing
+    instead of a stat per entry.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name not in _SKIPPED_DIRS:
+                        yield from _iter_py_files(Path(entry.path))
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+    except PermissionError:
+        pass  # Unreadable directories are skipped, as with rglob
+
+
+def _expand_contracts(contracts: tuple[str, ...]) -> list[Path]:
+    """Expand directory arguments to the Python files beneath them."""
+    paths: list[Path] = []
+    for contract in contracts:
+        path = Path(contract)
+        if path.is_dir():
+            paths.extend(sorted(_iter_py_files(path)))
+        else:
+            paths.append(path)
+    if not paths:
+        raise click.UsageError("No contract files found")
+    return paths
+
+
+def _lint_worker(args: tuple[str, bool]) -> dict:
+    """Lint one contract in a worker process (top-level so it pickles)."""
+    path, use_cache = args
+    return lint_contract_cached(path, use_cache=use_cache).to_dict()
+
+
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 4
+
+
+def _content_keys(paths: list[Path]) -> list[object]:
+    """Key each path so that files with identical contents share a key.
+
+    Only files whose size matches another file's are read and hashed; every
+    other file is keyed by its own path.
+    """
+    sizes: list[int | None] = []
+    for path in paths:
+        try:
+            sizes.append(os.stat(path).st_size)
+        except OSError:
+            sizes.append(None)
+    size_counts: dict[int | None, int] = {}
+    for size in sizes:
+        size_counts[size] = size_counts.get(size, 0) + 1
+
+    keys: list[object] = []
+    for path, size in zip(paths, sizes):
+        key: object = path
+        if size is not None and size_counts[size] > 1:
+            try:
+                key = hashlib.blake2b(path.read_bytes(), digest_size=16).digest()
+            except OSError:
+                pass  # Linted on its own; lint_contract reports the problem
+        keys.append(key)
+    return keys
+
+
+def _lint_paths(
+    paths: list[Path], use_cache: bool, jobs: int | None = None
+) -> list[LintResult]:
+    """Lint contracts, fanning out to a process pool for larger batches.
+
+    Files with identical contents are linted once; lint results carry no path.
+    jobs caps the worker count (default: one per CPU); jobs=1 lints in-process.
+    """
+    if len(paths) == 1:
+        return [lint_contract_cached(paths[0], use_cache=use_cache)]
+
+    first_seen: dict[object, int] = {}
+    unique_paths: list[Path] = []
+    slots: list[int] = []
+    for path, key in zip(paths, _content_keys(paths)):
+        if key not in first_seen:
+            first_seen[key] = len(unique_paths)
+            unique_paths.append(path)
+        slots.append(first_seen[key])
+
+    results = _lint_unique_paths(unique_paths, use_cache, jobs)
+    return [results[slot] for slot in slots]
+
+
+def _lint_unique_paths(
+    paths: list[Path], use_cache: bool, jobs: int | None
+) -> list[LintResult]:
+    """Lint contracts in order, in a process pool unless the batch is small."""
+    if len(paths) < _PARALLEL_MIN_FILES or jobs == 1:
+        return [lint_contract_cached(path, use_cache=use_cache) for path in paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            _lint_worker,
+            [(str(path), use_cache) for path in paths],
+            chunksize=max(1, len(paths) // (4 * workers)),
+        )
+        return [LintResult.from_dict(result) for result in results]
+
+
+_jobs_option = click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    help="Lint worker processes for several files (default: one per CPU)",
+)
 
 
 @main.command(name="check")
-@click.argument("contract", type=click.Path(exists=True))
+@click.argument("contracts", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option("--json", "json_output", is_flag=True, help="Output JSON (agent-friendly)")
-def check_cmd(contract, json_output):
-    """Run both lint and validate (default workflow)."""
-    contract_path = Path(contract)
+@click.option("--no-cache", is_flag=True, help="Re-lint even if the contract is unchanged")
+@_jobs_option
+@click.pass_obj
+def check_cmd(sdk_ctx, contracts, json_output, no_cache, jobs):
+    """Run both lint and validate (default workflow).
+
+    Accepts several contracts or directories; linting runs in parallel,
+    validation runs sequentially.
+    """
+    contract_paths = _expand_contracts(contracts)
 
     # Lint
-    lint_result = lint_contract(contract_path)
-
-    # Validate
-    progress_cb = None if json_output else print_progress
-    validate_result = validate_contract(
-        contract_path,
-        progress_callback=progress_cb,
-        soften_sdk_warnings=True,
-    )
-    if progress_cb:
-        click.echo()  # newline after progress
+    lint_results = _lint_paths(contract_paths, use_cache=not no_cache, jobs=jobs)
+
+    # Validate; artifacts are fetched at most once, by whichever contract first needs them
+    progress = None if json_output else make_progress()
+    progress_drawn = False
+
+    def progress_cb(downloaded: int, total: int):
+        nonlocal progress_drawn
+        progress_drawn = True
+        progress(downloaded, total)
+
+    validate_results = []
+    for contract_path in contract_paths:
+        validate_results.append(validate_contract(
+            contract_path,
+            progress_callback=progress_cb if progress else None,
+            soften_sdk_warnings=True,
+            sdk_ctx=sdk_ctx,
+        ))
+        if progress_drawn:
+            click.echo()  # newline after progress
+            progress_drawn = False
+
+    ok = all(r.ok for r in lint_results) and all(r.ok for r in validate_results)
 
     if json_output:
-        output = {
-            "ok": lint_result.ok and validate_result.ok,
-            "lint": lint_result.to_dict(),
-            "validate": validate_result.to_dict(),
-        }
+        if len(contract_paths) == 1:
+            output = {
+                "ok": ok,
+                "lint": lint_results[0].to_dict(),
+                "validate": validate_results[0].to_dict(),
+            }
+        else:
+            output = {
+                "ok": ok,
+                "files": [
+                    {
+                        "path": str(path),
+                        "ok": lint_result.ok and validate_result.ok,
+                        "lint": lint_result.to_dict(),
+                        "validate": validate_result.to_dict(),
+                    }
+                    for path, lint_result, validate_result in zip(
+                        contract_paths, lint_results, validate_results
+                    )
+                ],
+            }
         click.echo(format_json(output))
     else:
-        click.echo(format_human_lint(lint_result))
-        click.echo(format_human_validate(validate_result))
+        for path, lint_result, validate_result in zip(
+            contract_paths, lint_results, validate_results
+        ):
+            if len(contract_paths) > 1:
+                click.echo(f"{path}:")
+            click.echo(format_human_lint(lint_result))
+            click.echo(format_human_validate(validate_result))
 
-    sys.exit(0 if (lint_result.ok and validate_result.ok) else 1)
+    sys.exit(0 if ok else 1)
 
 
 @main.command()
-@click.argument("contract", type=click.Path(exists=True))
+@click.argument("contracts", nargs=-1, required=True, type=click.Path(exists=True))
 @click.option("--json", "json_output", is_flag=True, help="Output JSON")
-def lint(contract, json_output):
-    """Run fast AST-based safety checks only."""
-    result = lint_contract(Path(contract))
+@click.option("--no-cache", is_flag=True, help="Re-lint even if the contract is unchanged")
+@_jobs_option
+def lint(contracts, json_output, no_cache, jobs):
+    """Run fast AST-based safety checks only.
+
+    Accepts several contracts or directories, linted in parallel.
+    """
+    contract_paths = _expand_contracts(contracts)
+    results = _lint_paths(contract_paths, use_cache=not no_cache, jobs=jobs)
+    ok = all(r.ok for r in results)
 
     if json_output:
-        click.echo(format_json(result.to_dict()))
+        if len(contract_paths) == 1:
+            click.echo(format_json(results[0].to_dict()))
+        else:
+            click.echo(format_json({
+                "ok": ok,
+                "files": [
+                    {"path": str(path), **result.to_dict()}
+                    for path, result in zip(contract_paths, results)
+                ],
+            }))
     else:
-        click.echo(format_human_lint(result))
+        for path, result in zip(contract_paths, results):
+            if len(contract_paths) > 1:
+                click.echo(f"{path}:")
+            click.echo(format_human_lint(result))
 
-    sys.exit(0 if result.ok else 1)
+    sys.exit(0 if ok else 1)
 
 
 @main.command()
 @click.argument("contract", type=click.Path(exists=True))
 @click.option("--json", "json_output", is_flag=True, help="Output JSON")
-def validate(contract, json_output):
+@click.pass_obj
+def validate(sdk_ctx, contract, json_output):
     """Run SDK-based semantic validation."""
-    progress_cb = None if json_output else print_progress
-    result = validate_contract(Path(contract), progress_callback=progress_cb)
+    progress_cb = None if json_output else make_progress()
+    result = validate_contract(Path(contract), progress_callback=progress_cb, sdk_ctx=sdk_ctx)
     if progress_cb:
         click.echo()  # newline after progress
 
@@ -178,10 +406,11 @@ def validate(contract, json_output):
 @click.argument("contract", type=click.Path(exists=True))
 @click.option("--output", "-o", type=click.Path(), help="Write schema to file")
 @click.option("--json", "json_output", is_flag=True, help="Output JSON")
-def schema(contract, output, json_output):
+@click.pass_obj
+def schema(sdk_ctx, contract, output, json_output):
     """Extract ABI schema from contract."""
-    progress_cb = None if json_output else print_progress
-    result = validate_contract(Path(contract), progress_callback=progress_cb)
+    progress_cb = None if json_output else make_progress()
+    result = validate_contract(Path(contract), progress_callback=progress_cb, sdk_ctx=sdk_ctx)
     if progress_cb:
         click.echo()  # newline after progress
 
@@ -204,10 +433,13 @@ def schema(contract, output, json_output):
 
 
 @main.command()
-@click.option("--version", "-v", "version", help="GenVM version (e.g., v0.2.12)")
+@click.option(
+    "--version", "-v", "versions", multiple=True,
+    help="GenVM version (e.g., v0.2.12); repeat to download several concurrently",
+)
 @click.option("--list", "list_versions", is_flag=True, help="List cached versions")
 @click.option("--available", is_flag=True, help="List all available versions from GitHub")
-def download(version, list_versions, available):
+def download(versions, list_versions, available):
     """Pre-download GenVM artifacts for offline use."""
     if available:
         try:
@@ -234,27 +466,42 @@ def download(version, list_versions, available):
             click.echo("No cached versions")
         return
 
-    if version is None:
+    if not versions:
         click.echo("Fetching latest version...")
-        version = get_latest_version()
-        click.echo(f"Latest: {version}")
+        versions = (get_latest_version(),)
+        click.echo(f"Latest: {versions[0]}")
 
-    click.echo(f"Downloading GenVM {version}...")
+    if len(versions) == 1:
+        version = versions[0]
+        click.echo(f"Downloading GenVM {version}...")
 
-    def progress(downloaded: int, total: int):
-        if total > 0:
-            percent = min(100, downloaded * 100 // total)
-            mb_down = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            click.echo(f"\r  {mb_down:.1f}/{mb_total:.1f} MB ({percent}%)", nl=False)
+        try:
+            path = download_artifacts(version, progress_callback=make_progress("  "))
+            click.echo()  # newline after progress
+            click.echo(f"✓ Downloaded to {path}")
+        except Exception as e:
+            click.echo()
+            click.echo(f"✗ Download failed: {e}", err=True)
+            sys.exit(3)
+        return
 
-    try:
-        path = download_artifacts(version, progress_callback=progress)
-        click.echo()  # newline after progress
-        click.echo(f"✓ Downloaded to {path}")
-    except Exception as e:
-        click.echo()
-        click.echo(f"✗ Download failed: {e}", err=True)
+    # Downloads are network-bound, so threads overlap them; per-chunk progress
+    # would interleave, so report each version as it completes instead.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    versions = list(dict.fromkeys(versions))
+    click.echo(f"Downloading GenVM {', '.join(versions)}...")
+    failed = False
+    with ThreadPoolExecutor(max_workers=len(versions)) as executor:
+        futures = {executor.submit(download_artifacts, v): v for v in versions}
+        for future in as_completed(futures):
+            version = futures[future]
+            try:
+                click.echo(f"✓ {version} downloaded to {future.result()}")
+            except Exception as e:
+                click.echo(f"✗ {version} download failed: {e}", err=True)
+                failed = True
+    if failed:
         sys.exit(3)
 
 
@@ -283,16 +530,11 @@ def stubs(version, output, list_versions):
 
     click.echo(f"Generating stubs for GenVM {version}...")
 
-    def progress(downloaded: int, total: int):
-        if total > 0:
-            percent = min(100, downloaded * 100 // total)
-            mb_down = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            click.echo(f"\r  Downloading SDK: {mb_down:.1f}/{mb_total:.1f} MB ({percent}%)", nl=False)
-
     try:
         output_path = Path(output) if output else None
-        stubs_path = generate_stubs(version, output_path, progress_callback=progress)
+        stubs_path = generate_stubs(
+            version, output_path, progress_callback=make_progress("  Downloading SDK: ")
+        )
         click.echo()  # newline after progress
         click.echo(f"✓ Stubs generated at {stubs_path}")
         click.echo()
@@ -331,12 +573,7 @@ def setup(version, contract, json_output):
     if not json_output:
         click.echo("Setting up GenVM SDK...")
 
-    def progress(downloaded: int, total: int):
-        if not json_output and total > 0:
-            percent = min(100, downloaded * 100 // total)
-            mb_down = downloaded / (1024 * 1024)
-            mb_total = total / (1024 * 1024)
-            click.echo(f"\r  Downloading: {mb_down:.1f}/{mb_total:.1f} MB ({percent}%)", nl=False)
+    progress = None if json_output else make_progress("  Downloading: ")
 
     try:
         # Download tarball
@@ -382,57 +619,38 @@ def setup(version, contract, json_output):
         sys.exit(1)
 
 
-@main.command()
-@click.argument("contract", type=click.Path(exists=True))
-@click.option("--json", "json_output", is_flag=True, help="Output JSON (agent-friendly)")
-@click.option("--strict", is_flag=True, help="Enable strict type checking mode")
-@click.option("--all", "show_all", is_flag=True, help="Show all errors (disable SDK-related suppressions)")
-def typecheck(contract, json_output, strict, show_all):
-    """Run Pyright type checking with GenLayer SDK configured.
+# pyright --outputjson reports severity by name; older releases used LSP integers
+_PYRIGHT_SEVERITIES = {1: "error", 2: "warning", 3: "information"}
 
-    Uses pyright (Pylance's open-source core) to type-check contracts
-    with the correct SDK paths automatically configured.
 
-    Example:
-        genvm-lint typecheck contract.py --json
-    """
-    import subprocess
-    import tempfile
-
-    contract_path = Path(contract)
+def _severity_name(diagnostic: dict) -> str:
+    """Normalize a pyright diagnostic severity to its name."""
+    severity = diagnostic.get("severity")
+    return _PYRIGHT_SEVERITIES.get(severity, severity) if severity is not None else "?"
 
-    if not json_output:
-        click.echo(f"Type checking {contract_path.name}...")
 
-    # Parse contract header for SDK version
-    deps = parse_contract_header(contract_path)
+def _severity_summary(diagnostics: list[dict]) -> dict:
+    """Count pyright diagnostics by severity."""
+    names = [_severity_name(d) for d in diagnostics]
+    return {
+        "errors": names.count("error"),
+        "warnings": names.count("warning"),
+        "info": names.count("information"),
+    }
 
-    # Download SDK if needed
-    def progress(downloaded: int, total: int):
-        if not json_output and total > 0:
-            percent = min(100, downloaded * 100 // total)
-            click.echo(f"\r  Downloading SDK: {percent}%", nl=False)
 
-    try:
-        tarball_path = download_artifacts(None, progress_callback=progress)
-        if not json_output and deps:
-            click.echo()  # newline after progress
-    except Exception as e:
-        if json_output:
-            click.echo(json.dumps({"ok": False, "error": f"Failed to download SDK: {e}"}))
-        else:
-            click.echo(f"Failed to download SDK: {e}", err=True)
-        sys.exit(1)
+def _typecheck_fail(msg: str, json_output: bool):
+    """Report a typecheck setup failure and exit."""
+    if json_output:
+        click.echo(json.dumps({"ok": False, "error": msg}))
+    else:
+        click.echo(msg, err=True)
+    sys.exit(1)
 
-    # Extract SDK paths
-    sdk_paths, _upgrade_notes = extract_sdk_paths(tarball_path, deps)
-    extra_paths = []
-    for path in sdk_paths:
-        src_path = path / "src" if (path / "src").exists() else path
-        extra_paths.append(str(src_path))
 
-    # Create temporary pyrightconfig.json
-    # Note: "include" with absolute paths is ignored by pyright, so we pass file as argument
+def _pyright_config(extra_paths: list[str], strict: bool, show_all: bool) -> dict:
+    """Build the pyright configuration for a set of SDK paths."""
+    # Note: "include" with absolute paths is ignored by pyright, so files are passed as arguments
     pyright_config: dict = {
         "extraPaths": extra_paths,
         "typeCheckingMode": "strict" if strict else "basic",
@@ -448,71 +666,242 @@ def typecheck(contract, json_output, strict, show_all):
             "reportReturnType": "none",  # int/u256 NewType compat (runtime equivalent)
         })
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(pyright_config, f)
-        config_path = f.name
+    return pyright_config
+
+
+def _write_pyright_config(pyright_config: dict) -> Path:
+    """Persist a pyright config under the cache dir, reusing an identical one."""
+    data = json.dumps(pyright_config, sort_keys=True)
+    digest = hashlib.sha1(data.encode()).hexdigest()[:16]
+    config_path = get_cache_dir() / f"pyright-{digest}.json"
+    if not config_path.exists():
+        tmp_path = config_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(data)
+        os.replace(tmp_path, config_path)
+    return config_path
+
+
+# Cached typecheck results kept; least recently used entries beyond this are removed
+_TYPECHECK_CACHE_LIMIT = 512
+
+
+def _typecheck_cache_dir() -> Path:
+    return get_cache_dir() / "typecheck"
+
+
+def _typecheck_cache_key(contract_path: Path, pyright_config: dict) -> str:
+    """Key diagnostics on contract bytes and location, config (incl. SDK paths) and tools."""
+    from importlib.metadata import PackageNotFoundError, version
 
     try:
-        # Run pyright with file as argument (not in config, since absolute paths are ignored)
-        result = subprocess.run(
-            ["pyright", "--project", config_path, str(contract_path.absolute()), "--outputjson"],
-            capture_output=True,
-            text=True,
-        )
+        pyright_version = version("pyright")
+    except PackageNotFoundError:
+        pyright_version = "unknown"
 
-        pyright_output = json.loads(result.stdout) if result.stdout else {}
-        diagnostics = pyright_output.get("generalDiagnostics", [])
+    h = hashlib.blake2b(contract_path.read_bytes())
+    h.update(str(contract_path.resolve()).encode())
+    h.update(json.dumps(pyright_config, sort_keys=True).encode())
+    h.update(f"{__version__}:{pyright_version}".encode())
+    return h.hexdigest()
 
-        # Filter to only show errors from the contract file (not SDK)
-        contract_diagnostics = [
-            d for d in diagnostics
-            if contract_path.name in d.get("file", "")
-        ]
 
-        if json_output:
+def _read_typecheck_cache(key: str) -> list[dict] | None:
+    path = _typecheck_cache_dir() / f"{key}.json"
+    try:
+        diagnostics = json.loads(path.read_text())
+        os.utime(path)  # mark as recently used
+    except (OSError, ValueError):
+        return None
+    return diagnostics
+
+
+def _write_typecheck_cache(key: str, diagnostics: list[dict]) -> None:
+    cache_dir = _typecheck_cache_dir()
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+        tmp_path.write_text(json.dumps(diagnostics))
+        os.replace(tmp_path, cache_dir / f"{key}.json")
+
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith(".json")]
+        if len(entries) > _TYPECHECK_CACHE_LIMIT:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[: len(entries) - _TYPECHECK_CACHE_LIMIT]:
+                Path(entry.path).unlink(missing_ok=True)
+    except OSError:
+        pass  # the cache is best-effort
+
+
+@main.command()
+@click.argument("contracts", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--json", "json_output", is_flag=True, help="Output JSON (agent-friendly)")
+@click.option("--strict", is_flag=True, help="Enable strict type checking mode")
+@click.option("--all", "show_all", is_flag=True, help="Show all errors (disable SDK-related suppressions)")
+@click.option("--watch", is_flag=True, help="Keep pyright running and re-check on file changes")
+@click.option("--no-cache", is_flag=True, help="Re-run pyright even if nothing changed")
+@click.pass_obj
+def typecheck(sdk_ctx, contracts, json_output, strict, show_all, watch, no_cache):
+    """Run Pyright type checking with GenLayer SDK configured.
+
+    Uses pyright (Pylance's open-source core) to type-check contracts
+    with the correct SDK paths automatically configured. Contracts that
+    share the same SDK dependencies are checked in a single pyright run.
+    With --watch, one long-lived pyright process re-checks on every save.
+
+    Example:
+        genvm-lint typecheck contract.py --json
+        genvm-lint typecheck contracts/*.py
+        genvm-lint typecheck contract.py --watch
+    """
+    import subprocess
+
+    if watch and json_output:
+        raise click.UsageError("--watch cannot be combined with --json")
+
+    contract_paths = list(dict.fromkeys(Path(c) for c in contracts))
+
+    if not json_output:
+        names = ", ".join(p.name for p in contract_paths)
+        click.echo(f"Type checking {names}...")
+
+    # Group contracts by SDK dependencies; each group shares one config and one pyright run
+    groups: dict[tuple, list[Path]] = {}
+    for path in contract_paths:
+        deps = parse_contract_header(path)
+        groups.setdefault(tuple(sorted(deps.items())), []).append(path)
+
+    if watch and len(groups) > 1:
+        raise click.UsageError("--watch needs contracts that share the same SDK dependencies")
+
+    # Download SDK if needed
+    progress = None if json_output else make_progress("  Downloading SDK: ")
+
+    try:
+        sdk_ctx.artifact_path(progress_callback=progress)
+        if not json_output and any(groups):
+            click.echo()  # newline after progress
+    except Exception as e:
+        _typecheck_fail(f"Failed to download SDK: {e}", json_output)
+
+    if watch:
+        ((dep_key, group_paths),) = groups.items()
+        pyright_config = _pyright_config(sdk_ctx.extra_paths(dict(dep_key)), strict, show_all)
+        config_path = _write_pyright_config(pyright_config)
+
+        # pyright keeps its own program state between re-checks; let it own the terminal
+        returncode = 0
+        try:
+            returncode = subprocess.run([
+                "pyright",
+                "--project", str(config_path),
+                *(str(path.absolute()) for path in group_paths),
+                "--watch",
+            ]).returncode
+        except FileNotFoundError:
+            _typecheck_fail("pyright not found. Install with: pip install pyright", json_output)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(returncode)
+
+    diagnostics_by_file: dict[Path, list[dict]] = {path: [] for path in contract_paths}
+
+    for dep_key, all_group_paths in groups.items():
+        # Extract SDK paths
+        pyright_config = _pyright_config(sdk_ctx.extra_paths(dict(dep_key)), strict, show_all)
+
+        # Serve unchanged contracts from the diagnostics cache; only the rest go to pyright
+        cache_keys = {}
+        group_paths = []
+        for path in all_group_paths:
+            cache_keys[path] = _typecheck_cache_key(path, pyright_config)
+            cached = None if no_cache else _read_typecheck_cache(cache_keys[path])
+            if cached is None:
+                group_paths.append(path)
+            else:
+                diagnostics_by_file[path] = cached
+        if not group_paths:
+            continue
+
+        config_path = _write_pyright_config(pyright_config)
+
+        # Arguments naming the same file (duplicates, symlinks) share its diagnostics
+        owners: dict[Path, list[Path]] = {}
+        for path in group_paths:
+            owners.setdefault(path.resolve(), []).append(path)
+
+        try:
+            # Run pyright with files as arguments (not in config, since absolute paths are ignored)
+            result = subprocess.run(
+                [
+                    "pyright",
+                    "--project", str(config_path),
+                    *(str(paths[0].absolute()) for paths in owners.values()),
+                    "--outputjson",
+                ],
+                capture_output=True,
+                text=True,
+            )
+            pyright_output = json.loads(result.stdout) if result.stdout else {}
+        except FileNotFoundError:
+            _typecheck_fail("pyright not found. Install with: pip install pyright", json_output)
+        except json.JSONDecodeError as e:
+            _typecheck_fail(f"Failed to parse pyright output: {e}", json_output)
+
+        # Partition diagnostics by contract file, dropping anything reported for the SDK
+        for d in pyright_output.get("generalDiagnostics", []):
+            for owner in owners.get(Path(d.get("file", "")).resolve(), ()):
+                diagnostics_by_file[owner].append(d)
+
+        # Only a completed run is cacheable (a crashed pyright reports no diagnostics key)
+        if not no_cache and "generalDiagnostics" in pyright_output:
+            for path in group_paths:
+                _write_typecheck_cache(cache_keys[path], diagnostics_by_file[path])
+
+    total = sum(len(diags) for diags in diagnostics_by_file.values())
+
+    if json_output:
+        if len(contract_paths) == 1:
+            contract_diagnostics = diagnostics_by_file[contract_paths[0]]
             output = {
                 "ok": len(contract_diagnostics) == 0,
                 "diagnostics": contract_diagnostics,
-                "summary": {
-                    "errors": sum(1 for d in contract_diagnostics if d.get("severity") == 1),
-                    "warnings": sum(1 for d in contract_diagnostics if d.get("severity") == 2),
-                    "info": sum(1 for d in contract_diagnostics if d.get("severity") == 3),
+                "summary": _severity_summary(contract_diagnostics),
+            }
+        else:
+            output = {
+                "ok": total == 0,
+                "files": {
+                    str(path): {
+                        "ok": len(diags) == 0,
+                        "diagnostics": diags,
+                        "summary": _severity_summary(diags),
+                    }
+                    for path, diags in diagnostics_by_file.items()
                 },
+                "summary": _severity_summary(
+                    [d for diags in diagnostics_by_file.values() for d in diags]
+                ),
             }
-            click.echo(json.dumps(output, indent=2))
+        click.echo(json.dumps(output, indent=2))
+    else:
+        if total == 0:
+            click.echo("✓ No type errors found")
         else:
-            if not contract_diagnostics:
-                click.echo("✓ No type errors found")
-            else:
-                for d in contract_diagnostics:
-                    severity = {1: "error", 2: "warning", 3: "info"}.get(d.get("severity"), "?")
+            for path, diags in diagnostics_by_file.items():
+                label = path.name if len(contract_paths) == 1 else str(path)
+                for d in diags:
+                    severity = _severity_name(d)
                     line = d.get("range", {}).get("start", {}).get("line", 0) + 1
                     msg = d.get("message", "")
                     rule = d.get("rule", "")
-                    click.echo(f"{contract_path.name}:{line}: {severity}: {msg} [{rule}]")
-
-                errors = sum(1 for d in contract_diagnostics if d.get("severity") == 1)
-                warnings = sum(1 for d in contract_diagnostics if d.get("severity") == 2)
-                click.echo(f"\n{errors} error(s), {warnings} warning(s)")
+                    click.echo(f"{label}:{line}: {severity}: {msg} [{rule}]")
 
-        sys.exit(0 if len(contract_diagnostics) == 0 else 1)
+            summary = _severity_summary(
+                [d for diags in diagnostics_by_file.values() for d in diags]
+            )
+            click.echo(f"\n{summary['errors']} error(s), {summary['warnings']} warning(s)")
 
-    except FileNotFoundError:
-        msg = "pyright not found. Install with: pip install pyright"
-        if json_output:
-            click.echo(json.dumps({"ok": False, "error": msg}))
-        else:
-            click.echo(msg, err=True)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        msg = f"Failed to parse pyright output: {e}"
-        if json_output:
-            click.echo(json.dumps({"ok": False, "error": msg}))
-        else:
-            click.echo(msg, err=True)
-        sys.exit(1)
-    finally:
-        Path(config_path).unlink(missing_ok=True)
+    sys.exit(0 if total == 0 else 1)
 
 
 @main.group()
@@ -538,7 +927,7 @@ def cache_list():
 @click.option("--all", "clean_all", is_flag=True, help="Remove all cached versions")
 @click.option("--dry-run", is_flag=True, help="Show what would be deleted")
 def cache_clean(keep, clean_all, dry_run):
-    """Remove old cached versions.
+    """Remove old cached versions and cached lint/typecheck results.
 
     By default keeps the latest version. Use --all to remove everything.
     """
@@ -547,6 +936,7 @@ def cache_clean(keep, clean_all, dry_run):
 
     if dry_run:
         versions = list_cached_versions()
+        latest = None
         if keep_latest:
             try:
                 latest = get_latest_version()
@@ -556,16 +946,9 @@ def cache_clean(keep, clean_all, dry_run):
         for v in versions:
             if keep_versions and v in keep_versions:
                 click.echo(f"Would keep: {v}")
-            elif keep_latest:
-                try:
-                    latest = get_latest_version()
-                    if v == latest:
-                        continue
-                except Exception:
-                    pass
-                click.echo(f"Would delete: {v}")
-            else:
+            elif v != latest:
                 click.echo(f"Would delete: {v}")
+        click.echo("Would delete: cached lint/typecheck results")
         return
 
     files_deleted, bytes_freed = clean_cache(keep_versions, keep_latest)
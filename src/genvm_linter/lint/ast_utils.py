@@ -1,6 +1,8 @@
 """Shared AST helpers for lint checks."""
 
 import ast
+import functools
+from collections.abc import Callable
 
 CONTRACT_BASE_NAMES = frozenset(
     {
@@ -15,6 +17,8 @@ CONTRACT_BASE_NAMES = frozenset(
 
 def dotted_name(node: ast.expr) -> str | None:
     """Return a dotted name for Name/Attribute expressions."""
+    if isinstance(node, ast.Name):
+        return node.id
     parts: list[str] = []
     current = node
     while isinstance(current, ast.Attribute):
@@ -28,4 +32,58 @@ def dotted_name(node: ast.expr) -> str | None:
 
 def is_contract_subclass(node: ast.ClassDef) -> bool:
     """Return whether a class uses a supported GenLayer Contract base spelling."""
-    return any(dotted_name(base) in CONTRACT_BASE_NAMES for base in node.bases)
+    for base in node.bases:
+        # Every supported spelling ends in "Contract"; check that before
+        # building the dotted name
+        if isinstance(base, ast.Attribute):
+            tail = base.attr
+        elif isinstance(base, ast.Name):
+            tail = base.id
+        else:
+            continue
+        if tail == "Contract" and dotted_name(base) in CONTRACT_BASE_NAMES:
+            return True
+    return False
+
+
+class FastVisitor(ast.NodeVisitor):
+    """NodeVisitor that dispatches through a per-class {node type: method} table.
+
+    ast.NodeVisitor.visit builds "visit_" + class name and does a getattr for
+    every node; here the lookup is a single dict access.
+    """
+
+    _dispatch: dict[type, Callable[..., object]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        dispatch = {}
+        for name in dir(cls):
+            if not name.startswith("visit_"):
+                continue
+            method = getattr(cls, name)
+            # Skip NodeVisitor's own visit_Constant compatibility shim
+            if method is getattr(ast.NodeVisitor, name, None):
+                continue
+            node_type = getattr(ast, name[6:], None)
+            if isinstance(node_type, type):
+                dispatch[node_type] = method
+        cls._dispatch = dispatch
+
+    def visit(self, node: ast.AST):
+        method = self._dispatch.get(type(node))
+        if method is None:
+            return self.generic_visit(node)
+        return method(self, node)
+
+
+@functools.lru_cache(maxsize=128)
+def parse_cached(source: str) -> ast.Module | None:
+    """Parse source, memoizing the tree; returns None on a syntax error.
+
+    Trees are shared between callers and must be treated as read-only.
+    """
+    try:
+        return ast.parse(source)
+    except SyntaxError:
+        return None
@@ -0,0 +1,123 @@
+"""On-disk cache of lint results keyed by contract content."""
+
+import functools
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from .. import __version__
+from .linter import LintResult, lint_contract
+
+CACHE_DIR = Path.home() / ".cache" / "genvm-linter" / "lint"
+
+# Cached lint results kept; least recently used entries beyond this are removed
+_LINT_CACHE_LIMIT = 1024
+
+# Files modified more recently than this are not cached by stat_key: a second
+# edit within the filesystem's mtime granularity could keep mtime and size
+_MTIME_SETTLE_NS = 2_000_000_000
+
+
+@functools.lru_cache(maxsize=1)
+def _rules_fingerprint() -> bytes:
+    """Digest the linter version and the lint rule modules.
+
+    Rule edits then invalidate cached results even without a version bump,
+    e.g. in editable installs.
+    """
+    digest = hashlib.blake2b(__version__.encode())
+    for module in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(module.read_bytes())
+    return digest.digest()
+
+
+def cache_key(source: bytes) -> str:
+    """Key a contract's lint result by its bytes and the lint rules."""
+    return hashlib.blake2b(source + _rules_fingerprint()).hexdigest()
+
+
+def stat_key(path: Path, stat: os.stat_result) -> str:
+    """Key a contract's lint result by its location, mtime and size.
+
+    Cheaper than cache_key, which needs the file's bytes. A hit is trusted
+    without reading the file, so an edit that keeps the size and restores the
+    mtime (e.g. touch -r, some checkouts) is not detected; use --no-cache to
+    force a re-lint.
+    """
+    location = f"{os.path.abspath(path)}\0{stat.st_mtime_ns}\0{stat.st_size}"
+    return hashlib.blake2b(location.encode() + _rules_fingerprint()).hexdigest()
+
+
+def get(key: str) -> dict[str, Any] | None:
+    """Return the cached lint result dict for key, or None on a miss."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        result = json.loads(path.read_text())
+        os.utime(path)  # mark as recently used
+    except (OSError, ValueError):
+        return None
+    return result
+
+
+def put(key: str, result: dict[str, Any]) -> None:
+    """Store a lint result dict. Cache write failures are ignored."""
+    path = CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(result))
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        return
+    _trim()
+
+
+def _trim() -> None:
+    """Remove the least recently used entries beyond _LINT_CACHE_LIMIT."""
+    try:
+        entries = [e for e in os.scandir(CACHE_DIR) if e.name.endswith(".json")]
+        if len(entries) > _LINT_CACHE_LIMIT:
+            entries.sort(key=lambda e: e.stat().st_mtime)
+            for entry in entries[: len(entries) - _LINT_CACHE_LIMIT]:
+                Path(entry.path).unlink(missing_ok=True)
+    except OSError:
+        pass  # the cache is best-effort
+
+
+def lint_contract_cached(contract_path: Path | str, use_cache: bool = True) -> LintResult:
+    """Run lint_contract, serving unchanged contracts from the on-disk cache.
+
+    Args:
+        contract_path: Path to the contract file
+        use_cache: When False, always lint and leave the cache untouched
+
+    Returns:
+        LintResult with warnings
+    """
+    contract_path = Path(contract_path)
+    if not use_cache or not contract_path.is_file():
+        return lint_contract(contract_path)
+
+    # Unchanged mtime and size: serve the result without reading the contract.
+    # Stat before reading, so a concurrent edit can't be filed under it
+    stat = os.stat(contract_path)
+    location_key = stat_key(contract_path, stat)
+    cached = get(location_key)
+    if cached is not None:
+        return LintResult.from_dict(cached)
+
+    key = cache_key(contract_path.read_bytes())
+    cached = get(key)
+    if cached is not None:
+        result = LintResult.from_dict(cached)
+    else:
+        result = lint_contract(contract_path)
+        cached = result.to_dict()
+        put(key, cached)
+    if time.time_ns() - stat.st_mtime_ns >= _MTIME_SETTLE_NS:
+        put(location_key, cached)
+    return result
@@ -1,5 +1,6 @@
 """Main linter combining all AST-based checks."""
 
+import ast
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -29,6 +30,15 @@ class LintResult:
             result["warnings"] = self.warnings
         return result
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LintResult":
+        """Rebuild a result from the output of to_dict."""
+        return cls(
+            ok=data["ok"],
+            checks_passed=data["passed"],
+            warnings=data.get("warnings", []),
+        )
+
 
 def lint_contract(contract_path: Path | str) -> LintResult:
     """
@@ -52,8 +62,16 @@ def lint_contract(contract_path: Path | str) -> LintResult:
     all_warnings: list[dict[str, Any]] = []
     checks_passed = 0
 
+    # Parse once and share the tree between the checks
+    try:
+        tree = ast.parse(source)
+        syntax_error = None
+    except SyntaxError as e:
+        tree = None
+        syntax_error = e
+
     # Run safety checks
-    safety_warnings = check_safety(source)
+    safety_warnings = check_safety(source, tree)
     if safety_warnings:
         for w in safety_warnings:
             all_warnings.append({
@@ -66,7 +84,7 @@ def lint_contract(contract_path: Path | str) -> LintResult:
         checks_passed += 1
 
     # Run structure checks
-    structure_warnings = check_structure(source)
+    structure_warnings = check_structure(source, tree)
     if structure_warnings:
         for w in structure_warnings:
             all_warnings.append({
@@ -78,16 +96,14 @@ def lint_contract(contract_path: Path | str) -> LintResult:
     else:
         checks_passed += 1
 
-    # Syntax check (via ast.parse)
-    try:
-        import ast
-        ast.parse(source)
+    # Syntax check (via ast.parse above)
+    if syntax_error is None:
         checks_passed += 1
-    except SyntaxError as e:
+    else:
         all_warnings.append({
             "code": "E001",
-            "msg": f"Syntax error: {e.msg}",
-            "line": e.lineno or 1,
+            "msg": f"Syntax error: {syntax_error.msg}",
+            "line": syntax_error.lineno or 1,
         })
 
     has_errors = any(
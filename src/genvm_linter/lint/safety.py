@@ -1,10 +1,12 @@
 """AST-based safety checks for forbidden imports and non-deterministic patterns."""
 
 import ast
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
-from .ast_utils import is_contract_subclass
+from .ast_utils import FastVisitor, dotted_name, is_contract_subclass, parse_cached
 
 # Modules that are forbidden in GenLayer contracts (non-deterministic)
 FORBIDDEN_MODULES = frozenset({
@@ -44,6 +46,9 @@ FORBIDDEN_CALLS = frozenset({
     "uuid.uuid4",
 })
 
+# Last dotted segment of each forbidden call, to rule out most calls by attr name
+_FORBIDDEN_CALL_TAILS = frozenset(c.rpartition(".")[2] for c in FORBIDDEN_CALLS)
+
 # Built-in Python exception types that should not be raised in contracts.
 # These crash the GenVM WASM runtime (generic exit_code 1), lose the error
 # message, break consensus, and break downstream error parsing.
@@ -68,7 +73,7 @@ BUILTIN_EXCEPTIONS = frozenset({
 })
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SafetyWarning:
     """A safety warning from AST analysis."""
 
@@ -78,20 +83,198 @@ class SafetyWarning:
     col: int = 0
 
 
-class SafetyChecker(ast.NodeVisitor):
-    """AST visitor that checks for forbidden imports and non-deterministic patterns."""
+# Nodes with no children the safety visitor cares about: names, constants,
+# expression contexts, operators and import aliases. The walk skips them
+# instead of dispatching a no-op visit for each one.
+_LEAF_NODE_TYPES = frozenset({
+    ast.Name,
+    ast.Constant,
+    ast.alias,
+    *ast.expr_context.__subclasses__(),
+    *ast.boolop.__subclasses__(),
+    *ast.operator.__subclasses__(),
+    *ast.unaryop.__subclasses__(),
+    *ast.cmpop.__subclasses__(),
+})
+
+
+def _all_node_types(base: type) -> set[type]:
+    """Return base and all of its subclasses."""
+    types = {base}
+    for sub in base.__subclasses__():
+        types |= _all_node_types(sub)
+    return types
+
+
+# Node types the walk descends into. A single exact-type lookup both rules out
+# non-node field values (identifier strings in Global.names, etc.) and skips
+# leaves, without an isinstance MRO walk per child.
+_BRANCH_NODE_TYPES = frozenset(_all_node_types(ast.AST) - _LEAF_NODE_TYPES)
+
+
+def _child_nodes(node: ast.AST) -> list[ast.AST]:
+    """Return node's AST children in field order, minus leaf nodes."""
+    children: list[ast.AST] = []
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if type(value) is list:
+            for item in value:
+                if type(item) in _BRANCH_NODE_TYPES:
+                    children.append(item)
+        elif type(value) in _BRANCH_NODE_TYPES:
+            children.append(value)
+    return children
+
+
+def _call_name(func: ast.expr) -> tuple[str, bool]:
+    """Return (dotted name, rooted) for a call target.
+
+    rooted is False when the attribute chain does not start at a plain name
+    (e.g. ``f().a.b``); the name is then just the attribute tail ("a.b").
+    """
+    parts: list[str] = []
+    while isinstance(func, ast.Attribute):
+        parts.append(func.attr)
+        func = func.value
+    rooted = isinstance(func, ast.Name)
+    if rooted:
+        parts.append(func.id)
+    return ".".join(reversed(parts)), rooted
+
+
+class UnifiedSafetyVisitor(FastVisitor):
+    """Single-pass AST visitor collecting everything the safety checks need.
+
+    One walk produces:
+    - warnings: forbidden imports (W001), non-deterministic calls (W002) and
+      bare built-in exceptions raised in contracts (W004)
+    - calls: call graph mapping qualified function names to called names
+    - nondet_calls: gl.nondet.* calls and their enclosing scope
+    - safe_functions / lambda_scopes: functions handed to eq_principle or
+      run_nondet (safe contexts for nondet)
+    - nondet_forbidden: operations that are forbidden inside non-deterministic
+      blocks (E023-E026) and their enclosing function, plus the
+      evm_interface_classes needed to tell EVM calls from other calls
+
+    The walk is iterative: visit_* handlers run before a node's children and
+    do not recurse themselves. A handler that opens a scope returns a callback
+    that closes it once all of the node's descendants have been visited.
+    """
+
+    # Decorator names that mark a function as a safe entry point.
+    # Must stay in sync with _STRICT_EQ_CALLS in GL-S03.
+    _STRICT_EQ_DECORATORS = frozenset({
+        "eq_principle_strict_eq",
+        "gl.eq_principle_strict_eq",
+        "gl.eq_principle.strict_eq",
+        "eq_principle.strict_eq",
+    })
+
+    # Patterns that mark safe entry points, mapped to how many leading
+    # positional args are functions run in the nondet context.
+    # strict_eq entries must stay in sync with _STRICT_EQ_CALLS in GL-S03.
+    SAFE_PATTERNS = {
+        "gl.vm.run_nondet": 2,  # Both leader_fn and validator_fn args
+        "gl.vm.run_nondet_unsafe": 2,
+        "gl.eq_principle.strict_eq": 1,        # v0.1.3+ — first arg
+        "gl.eq_principle_strict_eq": 1,        # v0.1.0 gl attribute form
+        "eq_principle_strict_eq": 1,           # direct import alias
+        "eq_principle.strict_eq": 1,           # from genlayer.gl import eq_principle
+        "gl.eq_principle.prompt_comparative": 1,
+        "gl.eq_principle.prompt_non_comparative": 1,
+    }
 
     def __init__(self):
         self.warnings: list[SafetyWarning] = []
+        self.calls: dict[str, set[str]] = {}  # func_name -> set of called func names
+        self.nondet_calls: list[tuple[str | None, int, int]] = []  # (scope, line, col)
+        self.safe_functions: set[str] = set()
+        # Functions containing a lambda passed to a safe pattern
+        self.lambda_scopes: set[str] = set()
+        # (code, description, func_name, line, col, called class name); the
+        # class is set for calls that are E024 only if it is an EVM interface
+        self.nondet_forbidden: list[tuple[str, str, str, int, int, str | None]] = []
+        self.evm_interface_classes: set[str] = set()
+        self.current_class: str | None = None
+        self._current_func: str | None = None  # Innermost function, for nested names
+        self._current_lambda: str | None = None  # Innermost lambda, nondet scope
         self._contract_depth: int = 0
 
+    def _get_qualified_name(self, name: str) -> str:
+        """Get fully qualified name for a function/method."""
+        # For nested functions, include parent scope
+        if self._current_func:
+            return f"{self._current_func}.<locals>.{name}"
+        if self.current_class:
+            return f"{self.current_class}.{name}"
+        return name
+
+    def visit(self, node: ast.AST):
+        stack: list[ast.AST | Callable[[], object]] = [node]
+        dispatch = self._dispatch
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, ast.AST):
+                item()  # Leave a scope opened by a handler
+                continue
+            handler = dispatch.get(type(item))
+            if handler is not None:
+                leave = handler(self, item)
+                if leave is not None:
+                    stack.append(leave)
+            children = _child_nodes(item)
+            children.reverse()
+            stack.extend(children)
+
     def visit_ClassDef(self, node: ast.ClassDef):
-        is_contract = self._is_contract_class(node)
+        is_contract = is_contract_subclass(node)
         if is_contract:
             self._contract_depth += 1
-        self.generic_visit(node)
-        if is_contract:
-            self._contract_depth -= 1
+        for dec in node.decorator_list:
+            if dotted_name(dec) in _EVM_INTERFACE_DECORATORS:
+                self.evm_interface_classes.add(node.name)
+        old_class = self.current_class
+        self.current_class = node.name
+
+        def leave():
+            self.current_class = old_class
+            if is_contract:
+                self._contract_depth -= 1
+
+        return leave
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
+        func_name = self._get_qualified_name(node.name)
+        if func_name not in self.calls:
+            self.calls[func_name] = set()
+
+        # If nested, parent calls this function
+        if self._current_func:
+            self.calls[self._current_func].add(func_name)
+
+        if any(_decorator_name(dec) in self._STRICT_EQ_DECORATORS for dec in node.decorator_list):
+            self.safe_functions.add(func_name)
+
+        outer_func = self._current_func
+        self._current_func = func_name
+
+        def leave():
+            self._current_func = outer_func
+
+        return leave
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node: ast.Lambda):
+        # Lambdas belong to their containing function in the call graph, but
+        # get their own synthetic scope for locating nondet calls.
+        outer_lambda = self._current_lambda
+        self._current_lambda = f"<lambda:{node.lineno}:{node.col_offset}>"
+
+        def leave():
+            self._current_lambda = outer_lambda
+
+        return leave
 
     def visit_Raise(self, node: ast.Raise):
         if self._contract_depth > 0 and node.exc is not None:
@@ -105,14 +288,13 @@ class SafetyChecker(ast.NodeVisitor):
                         col=node.col_offset,
                     )
                 )
-        self.generic_visit(node)
 
     def visit_Import(self, node: ast.Import):
         for alias in node.names:
             # Check if full module path is allowed
             if alias.name in ALLOWED_MODULES:
                 continue
-            module_name = alias.name.split(".")[0]
+            module_name = alias.name.partition(".")[0]
             if module_name in FORBIDDEN_MODULES:
                 self.warnings.append(
                     SafetyWarning(
@@ -122,15 +304,11 @@ class SafetyChecker(ast.NodeVisitor):
                         col=node.col_offset,
                     )
                 )
-        self.generic_visit(node)
 
     def visit_ImportFrom(self, node: ast.ImportFrom):
-        if node.module:
-            # Check if full module path is allowed
-            if node.module in ALLOWED_MODULES:
-                self.generic_visit(node)
-                return
-            module_name = node.module.split(".")[0]
+        # Check if full module path is allowed
+        if node.module and node.module not in ALLOWED_MODULES:
+            module_name = node.module.partition(".")[0]
             if module_name in FORBIDDEN_MODULES:
                 self.warnings.append(
                     SafetyWarning(
@@ -140,12 +318,32 @@ class SafetyChecker(ast.NodeVisitor):
                         col=node.col_offset,
                     )
                 )
-        self.generic_visit(node)
 
     def visit_Call(self, node: ast.Call):
-        # Check for forbidden function calls like datetime.now()
-        call_name = self._get_call_name(node)
-        if call_name in FORBIDDEN_CALLS:
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            tail = func.attr
+            if (
+                self.current_class
+                and isinstance(func.value, ast.Name)
+                and func.value.id == "self"
+            ):
+                # self.method(): never a forbidden, nondet or safe-pattern call,
+                # only a call graph edge to ClassName.method
+                if self._current_func:
+                    self.calls[self._current_func].add(f"{self.current_class}.{tail}")
+                    if tail == "emit":
+                        self._add_nondet_forbidden("E023", ".emit()", node)
+                return
+        elif isinstance(func, ast.Name):
+            tail = func.id
+        else:
+            tail = None
+
+        call_name, rooted = _call_name(func)
+
+        # W002: forbidden function calls like time.time()
+        if tail in _FORBIDDEN_CALL_TAILS and call_name in FORBIDDEN_CALLS:
             self.warnings.append(
                 SafetyWarning(
                     code="W002",
@@ -155,281 +353,92 @@ class SafetyChecker(ast.NodeVisitor):
                 )
             )
 
-        self.generic_visit(node)
-
-    def _get_call_name(self, node: ast.Call) -> str:
-        """Extract the full name of a function call."""
-        if isinstance(node.func, ast.Name):
-            return node.func.id
-        elif isinstance(node.func, ast.Attribute):
-            parts = []
-            current = node.func
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-            return ".".join(reversed(parts))
-        return ""
+        if rooted:
+            # gl.nondet.* call, attributed to the innermost lambda or function
+            if call_name.startswith("gl.nondet."):
+                scope = self._current_lambda or self._current_func
+                self.nondet_calls.append((scope, node.lineno, node.col_offset))
 
-    def _is_contract_class(self, node: ast.ClassDef) -> bool:
-        """Check if the class inherits from a supported Contract base."""
-        return is_contract_subclass(node)
-
-    def _get_exception_name(self, node: ast.expr) -> str:
-        """Extract the exception class name from a raise target."""
-        if isinstance(node, ast.Call):
-            return self._get_exception_name(node.func)
-        if isinstance(node, ast.Name):
-            return node.id
-        return ""
-
-
-class CallGraphBuilder(ast.NodeVisitor):
-    """Build a call graph mapping functions to the functions they call."""
-
-    def __init__(self):
-        self.calls: dict[str, set[str]] = {}  # func_name -> set of called func names
-        self.current_class: str | None = None
-        self.function_stack: list[str] = []  # For nested functions
-
-    def _get_qualified_name(self, name: str) -> str:
-        """Get fully qualified name for a function/method."""
-        # For nested functions, include parent scope
-        if self.function_stack:
-            return f"{self.function_stack[-1]}.<locals>.{name}"
-        if self.current_class:
-            return f"{self.current_class}.{name}"
-        return name
-
-    def _get_current_scope(self) -> str | None:
-        """Get the current function scope."""
-        return self.function_stack[-1] if self.function_stack else None
+            # Functions handed to eq_principle / run_nondet are safe entry points
+            if tail in _SAFE_PATTERN_TAILS:
+                for arg in node.args[:self.SAFE_PATTERNS.get(call_name, 0)]:
+                    self._extract_function_from_arg(arg)
 
-    def visit_ClassDef(self, node: ast.ClassDef):
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
+        if self._current_func:
+            self._check_call_in_function(node, tail, call_name if rooted else None)
 
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        if func_name not in self.calls:
-            self.calls[func_name] = set()
+            # Call graph edge from the enclosing function
+            called_name = self._get_call_target(func, call_name)
+            if called_name:
+                self.calls[self._current_func].add(called_name)
 
-        # If nested, parent calls this function
-        if self.function_stack:
-            self.calls[self.function_stack[-1]].add(func_name)
+    def visit_Assign(self, node: ast.Assign):
+        if self._current_func:
+            for target in node.targets:
+                field = _self_storage_field(target)
+                if field:
+                    self._add_nondet_forbidden("E026", f"self.{field}", node)
+                    break
 
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
+    def visit_AugAssign(self, node: ast.AugAssign):
+        if self._current_func:
+            field = _self_storage_field(node.target)
+            if field:
+                self._add_nondet_forbidden("E026", f"self.{field}", node)
+
+    def _add_nondet_forbidden(
+        self, code: str, desc: str, node: ast.expr | ast.stmt, called_class: str | None = None
+    ):
+        self.nondet_forbidden.append((
+            code, desc, self._current_func,
+            node.lineno, node.col_offset, called_class,
+        ))
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        if func_name not in self.calls:
-            self.calls[func_name] = set()
+    def _check_call_in_function(self, node: ast.Call, tail: str | None, call_name: str | None):
+        """Record a call that is forbidden if its function runs non-deterministically."""
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            # E023: .emit()
+            if tail == "emit":
+                self._add_nondet_forbidden("E023", ".emit()", node)
 
-        if self.function_stack:
-            self.calls[self.function_stack[-1]].add(func_name)
+            # E026: mutating a container stored on self is a storage write too.
+            if tail in _STORAGE_MUTATOR_METHODS:
+                field = _self_storage_field(func.value)
+                if field:
+                    self._add_nondet_forbidden("E026", f"self.{field}.{tail}()", node)
 
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
+        # E024: gl.get_contract_at()
+        if call_name in CONTRACT_ACCESS_CALLS:
+            self._add_nondet_forbidden("E024", call_name + "()", node)
 
-    def visit_Lambda(self, node: ast.Lambda):
-        # Lambdas are part of their containing function's scope
-        self.generic_visit(node)
+        # E024: EVM interface instantiation; interface classes may be defined
+        # further down, so the class name is checked after the walk
+        if isinstance(func, ast.Name):
+            self._add_nondet_forbidden("E024", f"{func.id}(...)", node, func.id)
 
-    def visit_Call(self, node: ast.Call):
-        current_scope = self._get_current_scope()
-        if current_scope:
-            called_name = self._get_call_target(node)
-            if called_name:
-                self.calls[current_scope].add(called_name)
-        self.generic_visit(node)
+        # E025: nested run_nondet / eq_principle
+        if call_name in NONDET_SPAWN_CALLS:
+            self._add_nondet_forbidden("E025", call_name + "()", node)
 
-    def _get_call_target(self, node: ast.Call) -> str | None:
+    def _get_call_target(self, func: ast.expr, call_name: str) -> str | None:
         """Extract the target function name from a call."""
-        if isinstance(node.func, ast.Name):
+        if isinstance(func, ast.Name):
             # Could be a local nested function or a global
-            name = node.func.id
-            # Check if it's a nested function in current scope
-            if self.function_stack:
-                nested_name = f"{self.function_stack[-1]}.<locals>.{name}"
-                if nested_name in self.calls:
-                    return nested_name
-            return name
-        elif isinstance(node.func, ast.Attribute):
+            nested_name = f"{self._current_func}.<locals>.{func.id}"
+            if nested_name in self.calls:
+                return nested_name
+            return func.id
+        if isinstance(func, ast.Attribute):
             # Handle self.method() -> ClassName.method
-            if isinstance(node.func.value, ast.Name) and node.func.value.id == "self":
-                if self.current_class:
-                    return f"{self.current_class}.{node.func.attr}"
+            if (
+                isinstance(func.value, ast.Name)
+                and func.value.id == "self"
+                and self.current_class
+            ):
+                return f"{self.current_class}.{func.attr}"
             # Handle other attribute access
-            parts = []
-            current = node.func
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-            return ".".join(reversed(parts))
-        return None
-
-
-class NondetCallFinder(ast.NodeVisitor):
-    """Find all gl.nondet.* calls and their containing function."""
-
-    def __init__(self):
-        self.nondet_calls: list[tuple[str | None, int, int]] = []  # (func_name, line, col)
-        self.current_class: str | None = None
-        self.function_stack: list[str] = []
-
-    def _get_qualified_name(self, name: str) -> str:
-        # For nested functions, include parent scope
-        if self.function_stack:
-            return f"{self.function_stack[-1]}.<locals>.{name}"
-        if self.current_class:
-            return f"{self.current_class}.{name}"
-        return name
-
-    def _get_current_scope(self) -> str | None:
-        return self.function_stack[-1] if self.function_stack else None
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_Lambda(self, node: ast.Lambda):
-        lambda_scope = f"<lambda:{node.lineno}:{node.col_offset}>"
-        self.function_stack.append(lambda_scope)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_Call(self, node: ast.Call):
-        # Check if this is a gl.nondet.* call
-        call_name = self._get_full_call_name(node)
-        if call_name and call_name.startswith("gl.nondet."):
-            self.nondet_calls.append((
-                self._get_current_scope(),
-                node.lineno,
-                node.col_offset,
-            ))
-        self.generic_visit(node)
-
-    def _get_full_call_name(self, node: ast.Call) -> str | None:
-        """Get full dotted name of call like gl.nondet.web.get."""
-        parts = []
-        current = node.func
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-            return ".".join(reversed(parts))
-        return None
-
-
-class SafeEntryPointFinder(ast.NodeVisitor):
-    """Find functions passed to eq_principle/run_nondet (safe contexts for nondet)."""
-
-    # Decorator names that mark a function as a safe entry point.
-    # Must stay in sync with _STRICT_EQ_CALLS in GL-S03.
-    _STRICT_EQ_DECORATORS = frozenset({
-        "eq_principle_strict_eq",
-        "gl.eq_principle_strict_eq",
-        "gl.eq_principle.strict_eq",
-        "eq_principle.strict_eq",
-    })
-
-    # Patterns that mark safe entry points.
-    # strict_eq entries must stay in sync with _STRICT_EQ_CALLS in GL-S03.
-    SAFE_PATTERNS = {
-        "gl.vm.run_nondet": [0, 1],  # Both leader_fn and validator_fn args
-        "gl.vm.run_nondet_unsafe": [0, 1],
-        "gl.eq_principle.strict_eq": [0],        # v0.1.3+ — first arg
-        "gl.eq_principle_strict_eq": [0],        # v0.1.0 gl attribute form
-        "eq_principle_strict_eq": [0],           # direct import alias
-        "eq_principle.strict_eq": [0],           # from genlayer.gl import eq_principle
-        "gl.eq_principle.prompt_comparative": [0],
-        "gl.eq_principle.prompt_non_comparative": [0],
-    }
-
-    def __init__(self):
-        self.safe_functions: set[str] = set()
-        self.current_class: str | None = None
-        self.function_stack: list[str] = []
-        # Track lambdas that contain nondet - their containing scope is safe
-        self.lambda_scopes: set[str] = set()
-
-    def _get_qualified_name(self, name: str) -> str:
-        # For nested functions, include parent scope
-        if self.function_stack:
-            return f"{self.function_stack[-1]}.<locals>.{name}"
-        if self.current_class:
-            return f"{self.current_class}.{name}"
-        return name
-
-    def _get_current_scope(self) -> str | None:
-        return self.function_stack[-1] if self.function_stack else None
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        if any(_decorator_name(dec) in self._STRICT_EQ_DECORATORS for dec in node.decorator_list):
-            self.safe_functions.add(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        if any(_decorator_name(dec) in self._STRICT_EQ_DECORATORS for dec in node.decorator_list):
-            self.safe_functions.add(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_Call(self, node: ast.Call):
-        call_name = self._get_full_call_name(node)
-
-        if call_name in self.SAFE_PATTERNS:
-            arg_indices = self.SAFE_PATTERNS[call_name]
-            for idx in arg_indices:
-                if idx < len(node.args):
-                    arg = node.args[idx]
-                    self._extract_function_from_arg(arg)
-
-        self.generic_visit(node)
-
-    def _get_full_call_name(self, node: ast.Call) -> str | None:
-        parts = []
-        current = node.func
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-            return ".".join(reversed(parts))
+            return call_name
         return None
 
     def _extract_function_from_arg(self, arg: ast.expr):
@@ -438,9 +447,9 @@ class SafeEntryPointFinder(ast.NodeVisitor):
             # Direct function reference: run_nondet(leader_fn, ...)
             # This could be a nested function - qualify it with current scope
             name = arg.id
-            if self.function_stack:
+            if self._current_func:
                 # It's likely a local nested function
-                qualified = f"{self.function_stack[-1]}.<locals>.{name}"
+                qualified = f"{self._current_func}.<locals>.{name}"
                 self.safe_functions.add(qualified)
             self.safe_functions.add(name)  # Also add bare name for fallback
         elif isinstance(arg, ast.Attribute):
@@ -450,22 +459,30 @@ class SafeEntryPointFinder(ast.NodeVisitor):
                     self.safe_functions.add(f"{self.current_class}.{arg.attr}")
             else:
                 # Other attribute access
-                parts = []
-                current = arg
-                while isinstance(current, ast.Attribute):
-                    parts.append(current.attr)
-                    current = current.value
-                if isinstance(current, ast.Name):
-                    parts.append(current.id)
-                    self.safe_functions.add(".".join(reversed(parts)))
+                name = dotted_name(arg)
+                if name:
+                    self.safe_functions.add(name)
         elif isinstance(arg, ast.Lambda):
             # Lambda passed directly: eq_principle.strict_eq(lambda: ...)
-            # Register the lambda's own synthetic scope so NondetCallFinder
-            # can match it regardless of whether there's a containing function.
+            # Register the lambda's own synthetic scope so its nondet calls
+            # match regardless of whether there's a containing function.
             self.safe_functions.add(f"<lambda:{arg.lineno}:{arg.col_offset}>")
-            scope = self._get_current_scope()
-            if scope:
-                self.lambda_scopes.add(scope)
+            if self._current_func:
+                self.lambda_scopes.add(self._current_func)
+
+    def _get_exception_name(self, node: ast.expr) -> str:
+        """Extract the exception class name from a raise target."""
+        if isinstance(node, ast.Call):
+            return self._get_exception_name(node.func)
+        if isinstance(node, ast.Name):
+            return node.id
+        return ""
+
+
+# Last dotted segment of each safe pattern, to rule out most calls by attr name
+_SAFE_PATTERN_TAILS = frozenset(
+    p.rpartition(".")[2] for p in UnifiedSafetyVisitor.SAFE_PATTERNS
+)
 
 
 def is_reachable(call_graph: dict[str, set[str]], sources: set[str], target: str) -> bool:
@@ -473,21 +490,35 @@ def is_reachable(call_graph: dict[str, set[str]], sources: set[str], target: str
     if target in sources:
         return True
 
-    visited: set[str] = set()
-    queue = list(sources)
+    visited = set(sources)
+    stack = list(sources)
 
-    while queue:
-        current = queue.pop(0)
-        if current == target:
-            return True
-        if current in visited:
-            continue
-        visited.add(current)
-        queue.extend(call_graph.get(current, set()))
+    while stack:
+        for callee in call_graph.get(stack.pop(), ()):
+            if callee == target:
+                return True
+            if callee not in visited:
+                visited.add(callee)
+                stack.append(callee)
 
     return False
 
 
+def reachable_from(call_graph: dict[str, set[str]], sources: set[str]) -> set[str]:
+    """Return every function reachable from sources via call graph, sources included."""
+    # Order doesn't matter for a closure, so a plain list stack (DFS) will do
+    reachable = set(sources)
+    stack = list(sources)
+
+    while stack:
+        for callee in call_graph.get(stack.pop(), ()):
+            if callee not in reachable:
+                reachable.add(callee)
+                stack.append(callee)
+
+    return reachable
+
+
 # Calls that spawn non-deterministic blocks
 NONDET_SPAWN_CALLS = frozenset({
     "gl.vm.run_nondet",
@@ -522,176 +553,41 @@ _STORAGE_MUTATOR_METHODS = frozenset({
     "update",
 })
 
-
-def _find_evm_interface_classes(tree: ast.Module) -> set[str]:
-    """Find class names decorated with @gl.evm.contract_interface."""
-    classes = set()
-    for node in ast.walk(tree):
-        if not isinstance(node, ast.ClassDef):
-            continue
-        for dec in node.decorator_list:
-            parts = []
-            current = dec
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-                name = ".".join(reversed(parts))
-                if name in ("gl.evm.contract_interface", "genlayer.evm.contract_interface"):
-                    classes.add(node.name)
-    return classes
-
-
-class ForbiddenInNondetFinder(ast.NodeVisitor):
-    """Find operations that are forbidden inside non-deterministic blocks."""
-
-    def __init__(self, evm_interface_classes: set[str]):
-        # (code, description, func_name, line, col)
-        self.findings: list[tuple[str, str, str | None, int, int]] = []
-        self.current_class: str | None = None
-        self.function_stack: list[str] = []
-        self.evm_interface_classes = evm_interface_classes
-
-    def _get_qualified_name(self, name: str) -> str:
-        if self.function_stack:
-            return f"{self.function_stack[-1]}.<locals>.{name}"
-        if self.current_class:
-            return f"{self.current_class}.{name}"
-        return name
-
-    def _get_current_scope(self) -> str | None:
-        return self.function_stack[-1] if self.function_stack else None
-
-    def _add(self, code: str, desc: str, node: ast.expr | ast.stmt):
-        self.findings.append((
-            code, desc, self._get_current_scope(),
-            node.lineno, node.col_offset,
-        ))
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        old_class = self.current_class
-        self.current_class = node.name
-        self.generic_visit(node)
-        self.current_class = old_class
-
-    def visit_FunctionDef(self, node: ast.FunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
-        func_name = self._get_qualified_name(node.name)
-        self.function_stack.append(func_name)
-        self.generic_visit(node)
-        self.function_stack.pop()
-
-    def visit_Call(self, node: ast.Call):
-        # E023: .emit()
-        if isinstance(node.func, ast.Attribute) and node.func.attr == "emit":
-            self._add("E023", ".emit()", node)
-
-        # E026: mutating a container stored on self is a storage write too.
-        if (
-            isinstance(node.func, ast.Attribute)
-            and node.func.attr in _STORAGE_MUTATOR_METHODS
-        ):
-            field = self._self_storage_field(node.func.value)
-            if field:
-                self._add("E026", f"self.{field}.{node.func.attr}()", node)
-
-        call_name = self._get_full_call_name(node)
-
-        # E024: gl.get_contract_at()
-        if call_name in CONTRACT_ACCESS_CALLS:
-            self._add("E024", call_name + "()", node)
-
-        # E024: EVM interface instantiation
-        if isinstance(node.func, ast.Name) and node.func.id in self.evm_interface_classes:
-            self._add("E024", f"{node.func.id}(...)", node)
-
-        # E025: nested run_nondet / eq_principle
-        if call_name in NONDET_SPAWN_CALLS:
-            self._add("E025", call_name + "()", node)
-
-        self.generic_visit(node)
-
-    def visit_Assign(self, node: ast.Assign):
-        for target in node.targets:
-            field = self._self_storage_field(target)
-            if field:
-                self._add("E026", f"self.{field}", node)
-                break
-        self.generic_visit(node)
-
-    def visit_AugAssign(self, node: ast.AugAssign):
-        field = self._self_storage_field(node.target)
-        if field:
-            self._add("E026", f"self.{field}", node)
-        self.generic_visit(node)
-
-    def _self_storage_field(self, node: ast.expr) -> str | None:
-        """If node is self.xxx or self.xxx[...], return the field name."""
-        if isinstance(node, ast.Attribute):
-            if isinstance(node.value, ast.Name) and node.value.id == "self":
-                return node.attr
-        if isinstance(node, ast.Subscript):
-            return self._self_storage_field(node.value)
-        return None
-
-    def _get_full_call_name(self, node: ast.Call) -> str | None:
-        parts = []
-        current = node.func
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-            return ".".join(reversed(parts))
-        return None
+# Class decorators that declare an EVM contract interface
+_EVM_INTERFACE_DECORATORS = frozenset({
+    "gl.evm.contract_interface",
+    "genlayer.evm.contract_interface",
+})
 
 
-def check_forbidden_in_nondet(source: str) -> list[SafetyWarning]:
-    """
-    Check for operations forbidden inside non-deterministic blocks.
+def _self_storage_field(node: ast.expr) -> str | None:
+    """If node is self.xxx or self.xxx[...], return the field name."""
+    while isinstance(node, ast.Subscript):
+        node = node.value
+    if isinstance(node, ast.Attribute):
+        if isinstance(node.value, ast.Name) and node.value.id == "self":
+            return node.attr
+    return None
 
-    Detects .emit(), inter-contract calls, nested run_nondet, and storage
-    writes that are reachable from leader/validator functions.
-    """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
 
-    # Find EVM interface classes first
-    evm_classes = _find_evm_interface_classes(tree)
+def _safe_reachable(visitor: UnifiedSafetyVisitor) -> set[str]:
+    """Return the functions reachable from the safe entry points found by visitor."""
+    return reachable_from(visitor.calls, visitor.safe_functions | visitor.lambda_scopes)
 
-    # Find all forbidden operations
-    finder = ForbiddenInNondetFinder(evm_classes)
-    finder.visit(tree)
 
-    if not finder.findings:
+def _forbidden_in_nondet_warnings(
+    visitor: UnifiedSafetyVisitor, safe_reachable: set[str]
+) -> list[SafetyWarning]:
+    """Build E023-E026 warnings for visitor's findings in functions in safe_reachable."""
+    if not safe_reachable:
         return []
 
-    # Find nondet entry points
-    entry_finder = SafeEntryPointFinder()
-    entry_finder.visit(tree)
-    all_safe = entry_finder.safe_functions | entry_finder.lambda_scopes
-
-    if not all_safe:
-        return []
-
-    # Build call graph for reachability
-    cg_builder = CallGraphBuilder()
-    cg_builder.visit(tree)
-    call_graph = cg_builder.calls
-
+    evm_classes = visitor.evm_interface_classes
     warnings = []
-    for code, desc, func_name, line, col in finder.findings:
-        if func_name is None:
-            continue  # Module-level — not in a nondet block
-        if is_reachable(call_graph, all_safe, func_name):
+    for code, desc, func_name, line, col, called_class in visitor.nondet_forbidden:
+        if called_class is not None and called_class not in evm_classes:
+            continue  # Plain call, not an EVM interface instantiation
+        if func_name in safe_reachable:
             warnings.append(SafetyWarning(
                 code=code,
                 msg=f"{desc} in '{func_name}' reachable from non-deterministic block; {_NONDET_MESSAGES[code]}",
@@ -702,39 +598,12 @@ def check_forbidden_in_nondet(source: str) -> list[SafetyWarning]:
     return warnings
 
 
-def check_nondet_outside_eq_principle(source: str) -> list[SafetyWarning]:
-    """
-    Check for gl.nondet.* calls that are not in equivalence principle blocks.
-
-    These calls will cause consensus failures at runtime because validators
-    cannot agree on non-deterministic results without an equivalence principle.
-    """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return []
-
-    # Build call graph
-    cg_builder = CallGraphBuilder()
-    cg_builder.visit(tree)
-    call_graph = cg_builder.calls
-
-    # Find all nondet calls
-    nondet_finder = NondetCallFinder()
-    nondet_finder.visit(tree)
-    nondet_calls = nondet_finder.nondet_calls
-
-    # Find safe entry points
-    entry_finder = SafeEntryPointFinder()
-    entry_finder.visit(tree)
-    safe_functions = entry_finder.safe_functions
-    lambda_scopes = entry_finder.lambda_scopes
-
-    # Combine safe functions with lambda scopes
-    all_safe = safe_functions | lambda_scopes
-
+def _nondet_outside_eq_warnings(
+    visitor: UnifiedSafetyVisitor, safe_reachable: set[str]
+) -> list[SafetyWarning]:
+    """Build E010 warnings for nondet calls in visitor outside safe_reachable."""
     warnings = []
-    for func_name, line, col in nondet_calls:
+    for func_name, line, col in visitor.nondet_calls:
         if func_name is None:
             # Module-level nondet call - always error
             warnings.append(SafetyWarning(
@@ -743,7 +612,7 @@ def check_nondet_outside_eq_principle(source: str) -> list[SafetyWarning]:
                 line=line,
                 col=col,
             ))
-        elif not is_reachable(call_graph, all_safe, func_name):
+        elif func_name not in safe_reachable:
             warnings.append(SafetyWarning(
                 code="E010",
                 msg=f"gl.nondet.* call in '{func_name}' not reachable from equivalence principle block",
@@ -754,12 +623,65 @@ def check_nondet_outside_eq_principle(source: str) -> list[SafetyWarning]:
     return warnings
 
 
-def check_safety(source: str | Path) -> list[SafetyWarning]:
+def check_forbidden_in_nondet(
+    source: str, tree: ast.Module | None = None
+) -> list[SafetyWarning]:
+    """
+    Check for operations forbidden inside non-deterministic blocks.
+
+    Detects .emit(), inter-contract calls, nested run_nondet, and storage
+    writes that are reachable from leader/validator functions.
+    """
+    if tree is None:
+        tree = parse_cached(source)
+    if tree is None:
+        return []
+
+    visitor = UnifiedSafetyVisitor()
+    visitor.visit(tree)
+    return _forbidden_in_nondet_warnings(visitor, _safe_reachable(visitor))
+
+
+def check_nondet_outside_eq_principle(
+    source: str, tree: ast.Module | None = None
+) -> list[SafetyWarning]:
+    """
+    Check for gl.nondet.* calls that are not in equivalence principle blocks.
+
+    These calls will cause consensus failures at runtime because validators
+    cannot agree on non-deterministic results without an equivalence principle.
+    """
+    if tree is None:
+        tree = parse_cached(source)
+    if tree is None:
+        return []
+
+    visitor = UnifiedSafetyVisitor()
+    visitor.visit(tree)
+    return _nondet_outside_eq_warnings(visitor, _safe_reachable(visitor))
+
+
+# Every safety warning needs at least one of these words in the source: a
+# forbidden module or call, raise (W004), nondet (E010), or a safe entry point
+# (E023-E026, GL-S03). Sources without any of them skip parsing altogether.
+_QUICK_SCAN = re.compile(
+    r"\b(?:"
+    + "|".join(sorted(
+        FORBIDDEN_MODULES | _FORBIDDEN_CALL_TAILS | _SAFE_PATTERN_TAILS | {"raise", "nondet"}
+    ))
+    + r")\b"
+)
+
+
+def check_safety(
+    source: str | Path, tree: ast.Module | None = None
+) -> list[SafetyWarning]:
     """
     Check a contract for safety issues.
 
     Args:
         source: Contract source code or path to contract file
+        tree: Already-parsed module for source, to skip reparsing
 
     Returns:
         List of safety warnings
@@ -767,25 +689,35 @@ def check_safety(source: str | Path) -> list[SafetyWarning]:
     if isinstance(source, Path):
         source = source.read_text()
 
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    # Non-ASCII identifiers are NFKC-normalized by the parser, so only trust
+    # the textual prescreen for ASCII sources
+    if source.isascii() and _QUICK_SCAN.search(source) is None:
+        return []
+
+    if tree is None:
+        tree = parse_cached(source)
+    if tree is None:
         # Syntax errors are handled by the validate step
         return []
 
-    checker = SafetyChecker()
-    checker.visit(tree)
+    # One walk collects imports/calls/raises, the call graph, nondet calls
+    # and safe entry points for all of the checks below
+    visitor = UnifiedSafetyVisitor()
+    visitor.visit(tree)
+
+    # Everything reachable from an equivalence principle / run_nondet entry
+    safe_reachable = _safe_reachable(visitor)
 
     # Add nondet-outside-eq-principle check
-    nondet_warnings = check_nondet_outside_eq_principle(source)
+    nondet_warnings = _nondet_outside_eq_warnings(visitor, safe_reachable)
 
     # Add checks for operations forbidden inside nondet blocks
-    forbidden_warnings = check_forbidden_in_nondet(source)
+    forbidden_warnings = _forbidden_in_nondet_warnings(visitor, safe_reachable)
 
     # Semantic eq_principle quality check (GL-S03)
-    semantic_warnings = check_eq_strict_mismatch(source)
+    semantic_warnings = check_eq_strict_mismatch(source, tree)
 
-    return checker.warnings + nondet_warnings + forbidden_warnings + semantic_warnings
+    return visitor.warnings + nondet_warnings + forbidden_warnings + semantic_warnings
 
 
 # ---------------------------------------------------------------------------
@@ -795,15 +727,7 @@ def check_safety(source: str | Path) -> list[SafetyWarning]:
 
 def _full_call_name(node: ast.Call) -> str:
     """Return the full dotted name of a call, e.g. 'gl.eq_principle.strict_eq'."""
-    parts: list[str] = []
-    current: ast.expr = node.func
-    while isinstance(current, ast.Attribute):
-        parts.append(current.attr)
-        current = current.value
-    if isinstance(current, ast.Name):
-        parts.append(current.id)
-        return ".".join(reversed(parts))
-    return ""
+    return dotted_name(node.func) or ""
 
 
 # ---------------------------------------------------------------------------
@@ -866,18 +790,7 @@ def _s03_nondet_call(node: ast.expr) -> tuple[str, int] | None:
 
 def _decorator_name(dec: ast.expr) -> str:
     """Return the full dotted name of a decorator (Name or Attribute only), else ''."""
-    if isinstance(dec, ast.Name):
-        return dec.id
-    if isinstance(dec, ast.Attribute):
-        parts: list[str] = []
-        current: ast.expr = dec
-        while isinstance(current, ast.Attribute):
-            parts.append(current.attr)
-            current = current.value
-        if isinstance(current, ast.Name):
-            parts.append(current.id)
-            return ".".join(reversed(parts))
-    return ""
+    return dotted_name(dec) or ""
 
 
 def _get_compound_bodies(stmt: ast.stmt) -> list[list[ast.stmt]]:
@@ -1012,7 +925,9 @@ def _raw_nondet_in_func(
     return None
 
 
-def check_eq_strict_mismatch(source: str) -> list[SafetyWarning]:
+def check_eq_strict_mismatch(
+    source: str, tree: ast.Module | None = None
+) -> list[SafetyWarning]:
     """
     GL-S03: Flag eq_principle_strict_eq wrapping a lambda or function that returns
     raw nondeterministic output.
@@ -1020,9 +935,9 @@ def check_eq_strict_mismatch(source: str) -> list[SafetyWarning]:
     Conservative — only flags direct returns of nondet calls or simple passthroughs.
     When in doubt (processed output, unknown functions, multi-file), does not flag.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    if tree is None:
+        tree = parse_cached(source)
+    if tree is None:
         return []
 
     # Index module-level function definitions only — class methods must not collide
@@ -1075,7 +990,7 @@ def check_eq_strict_mismatch(source: str) -> list[SafetyWarning]:
                 return _raw_nondet_in_func(method_node, func_defs)
         return None
 
-    class _Visitor(ast.NodeVisitor):
+    class _Visitor(FastVisitor):
         def __init__(self) -> None:
             self.current_class: str | None = None
 
@@ -1085,13 +1000,13 @@ def check_eq_strict_mismatch(source: str) -> list[SafetyWarning]:
             self.generic_visit(node)
             self.current_class = old
 
-        def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        def visit_FunctionDef(
+            self, node: ast.FunctionDef | ast.AsyncFunctionDef
+        ) -> None:
             self._check_decorators(node)
             self.generic_visit(node)
 
-        def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:
-            self._check_decorators(node)
-            self.generic_visit(node)
+        visit_AsyncFunctionDef = visit_FunctionDef
 
         def _check_decorators(
             self, node: ast.FunctionDef | ast.AsyncFunctionDef
@@ -1,13 +1,15 @@
 """AST-based structure checks for GenLayer contracts."""
 
 import ast
+import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from .ast_utils import is_contract_subclass
+from .ast_utils import dotted_name, is_contract_subclass, parse_cached
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StructureWarning:
     """A structure warning from analysis."""
 
@@ -18,57 +20,121 @@ class StructureWarning:
 
 
 # Storage types that require special handling
-GENLAYER_STORAGE_TYPES = {"DynArray", "Array", "TreeMap"}
-FORBIDDEN_STORAGE_TYPES = {"list", "dict", "int"}
+GENLAYER_STORAGE_TYPES = frozenset({"DynArray", "Array", "TreeMap"})
+FORBIDDEN_STORAGE_TYPES = frozenset({"list", "dict", "int"})
 
+# Leading block of comment lines holding the dependency header
+_HEADER_RE = re.compile(r"(?:#[^\n]*(?:\n|\Z))+")
 
-class ContractStructureChecker(ast.NodeVisitor):
-    """Check GenLayer contract structure rules."""
+# Comparable types allowed as TreeMap keys
+_VALID_TREEMAP_KEY_TYPES = frozenset({"str", "Address", "u32", "u256", "i32", "i256", "bytes"})
+
+# Built-in and GenLayer type names that never need @allow_storage
+_NON_CLASS_STORAGE_TYPES = frozenset({
+    "str", "int", "bool", "bytes", "float",
+    "u256", "i256", "Address",
+    "DynArray", "Array", "TreeMap", "Literal",
+})
+
+
+# Method decorators the structure rules look for, as bit flags
+_PUBLIC_WRITE = 1
+_PUBLIC_VIEW = 2
+_DECORATOR_FLAGS = {
+    "gl.public.write": _PUBLIC_WRITE,
+    "gl.public.view": _PUBLIC_VIEW,
+}
+
+# Special methods and the decorator each one requires (E019)
+_SPECIAL_METHOD_DECORATORS = {
+    "__receive__": "gl.public.write",
+    "__on_bridge__": "gl.public.write",
+}
+
+
+def _decorator_to_string(dec: ast.expr) -> str | None:
+    """Convert decorator AST to string like 'gl.public.view'."""
+    while isinstance(dec, ast.Call):
+        dec = dec.func
+    return dotted_name(dec)
+
+
+# Statement fields that hold nested statements; class definitions can only
+# appear in these, never inside expressions
+_NESTED_STMT_FIELDS = frozenset({"body", "orelse", "finalbody", "handlers", "cases"})
+
+
+def _walk_statements(tree: ast.Module) -> Iterator[ast.AST]:
+    """Yield every statement in tree, pre-order, without entering expressions."""
+    stack: list[ast.AST] = list(reversed(tree.body))
+    while stack:
+        node = stack.pop()
+        yield node
+        children: list[ast.AST] = []
+        for field in node._fields:
+            if field in _NESTED_STMT_FIELDS:
+                children.extend(getattr(node, field))
+        children.reverse()
+        stack.extend(children)
+
+
+class ContractStructureChecker:
+    """Check GenLayer contract structure rules and collect storage classes.
+
+    Classes used in contract storage are gathered in the same pass; see
+    check_missing_decorators for the @allow_storage check.
+    """
 
     def __init__(self):
         self.warnings: list[StructureWarning] = []
         self.contract_classes: list[tuple[str, int, int]] = []  # (name, line, col)
-        self.current_class: ast.ClassDef | None = None
-        self.is_contract_class = False
+        self.storage_classes: set[str] = set()  # Classes used in storage
+        self.allow_storage_classes: set[str] = set()  # Classes with @allow_storage
+        self.class_locations: dict[str, tuple[int, int]] = {}  # class -> (line, col)
+
+    def run(self, tree: ast.Module):
+        """Check every class definition in tree, in source order."""
+        for node in _walk_statements(tree):
+            if type(node) is ast.ClassDef:
+                self._check_class(node)
 
-    def visit_ClassDef(self, node: ast.ClassDef):
+    def _check_class(self, node: ast.ClassDef):
         # Check if this is a Contract subclass
-        is_contract = self._is_contract_subclass(node)
+        is_contract = is_contract_subclass(node)
 
         if is_contract:
             self.contract_classes.append((node.name, node.lineno, node.col_offset))
-
-        old_class = self.current_class
-        old_is_contract = self.is_contract_class
-        self.current_class = node
-        self.is_contract_class = is_contract
-
-        if is_contract:
             self._check_contract_class(node)
 
-        self.generic_visit(node)
+        # Check if has @allow_storage decorator
+        for dec in node.decorator_list:
+            if _decorator_to_string(dec) in ("allow_storage", "gl.allow_storage"):
+                self.allow_storage_classes.add(node.name)
+                break
 
-        self.current_class = old_class
-        self.is_contract_class = old_is_contract
+        self.class_locations[node.name] = (node.lineno, node.col_offset)
 
-    def _is_contract_subclass(self, node: ast.ClassDef) -> bool:
-        """Check if the class inherits from a supported Contract base."""
-        return is_contract_subclass(node)
+        # Collect storage types of a Contract class
+        if is_contract:
+            for item in node.body:
+                if type(item) is ast.AnnAssign:
+                    self._collect_storage_types(item.annotation)
 
     def _check_contract_class(self, node: ast.ClassDef):
         """Check all rules for a contract class."""
         for item in node.body:
-            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            t = type(item)
+            if t is ast.FunctionDef or t is ast.AsyncFunctionDef:
                 self._check_method(item)
-            elif isinstance(item, ast.AnnAssign):
+            elif t is ast.AnnAssign:
                 # Storage field annotation
                 self._check_storage_field(item)
 
     def _check_method(self, node: ast.FunctionDef | ast.AsyncFunctionDef):
         """Check method-level rules."""
-        decorators = self._get_decorator_names(node)
-        is_public = "gl.public.write" in decorators or "gl.public.view" in decorators
-        is_view = "gl.public.view" in decorators
+        flags = self._get_decorator_flags(node)
+        is_public = bool(flags & (_PUBLIC_WRITE | _PUBLIC_VIEW))
+        is_view = bool(flags & _PUBLIC_VIEW)
 
         # E012: __init__ must be private
         if node.name == "__init__" and is_public:
@@ -89,19 +155,14 @@ class ContractStructureChecker(ast.NodeVisitor):
             ))
 
         # E019: Special methods need correct decorators
-        special_methods = {
-            "__receive__": "gl.public.write",
-            "__on_bridge__": "gl.public.write",
-        }
-        if node.name in special_methods:
-            required = special_methods[node.name]
-            if required not in decorators:
-                self.warnings.append(StructureWarning(
-                    code="E019",
-                    msg=f"'{node.name}' requires @{required} decorator",
-                    line=node.lineno,
-                    col=node.col_offset,
-                ))
+        required = _SPECIAL_METHOD_DECORATORS.get(node.name)
+        if required is not None and not flags & _DECORATOR_FLAGS[required]:
+            self.warnings.append(StructureWarning(
+                code="E019",
+                msg=f"'{node.name}' requires @{required} decorator",
+                line=node.lineno,
+                col=node.col_offset,
+            ))
 
         # W020: View methods should have return type annotation (for schema generation)
         if is_view and node.returns is None:
@@ -146,25 +207,25 @@ class ContractStructureChecker(ast.NodeVisitor):
         field_name = node.target.id
         annotation = node.annotation
 
-        # E015: No raw int in storage
-        if isinstance(annotation, ast.Name) and annotation.id == "int":
-            self.warnings.append(StructureWarning(
-                code="E015",
-                msg=f"Storage field '{field_name}' cannot use raw 'int'; use u256/i256",
-                line=node.lineno,
-                col=node.col_offset,
-            ))
+        match annotation:
+            # E015: No raw int in storage
+            case ast.Name(id="int"):
+                self.warnings.append(StructureWarning(
+                    code="E015",
+                    msg=f"Storage field '{field_name}' cannot use raw 'int'; use u256/i256",
+                    line=node.lineno,
+                    col=node.col_offset,
+                ))
 
-        # E016: No list/dict in storage
-        if isinstance(annotation, ast.Name):
-            if annotation.id == "list":
+            # E016: No list/dict in storage, bare or subscripted (list[X], dict[K, V])
+            case ast.Name(id="list") | ast.Subscript(value=ast.Name(id="list")):
                 self.warnings.append(StructureWarning(
                     code="E016",
                     msg=f"Storage field '{field_name}' cannot use 'list'; use DynArray",
                     line=node.lineno,
                     col=node.col_offset,
                 ))
-            elif annotation.id == "dict":
+            case ast.Name(id="dict") | ast.Subscript(value=ast.Name(id="dict")):
                 self.warnings.append(StructureWarning(
                     code="E016",
                     msg=f"Storage field '{field_name}' cannot use 'dict'; use TreeMap",
@@ -172,32 +233,12 @@ class ContractStructureChecker(ast.NodeVisitor):
                     col=node.col_offset,
                 ))
 
-        # Check subscripted types: list[X], dict[K,V]
-        if isinstance(annotation, ast.Subscript):
-            if isinstance(annotation.value, ast.Name):
-                if annotation.value.id == "list":
-                    self.warnings.append(StructureWarning(
-                        code="E016",
-                        msg=f"Storage field '{field_name}' cannot use 'list'; use DynArray",
-                        line=node.lineno,
-                        col=node.col_offset,
-                    ))
-                elif annotation.value.id == "dict":
-                    self.warnings.append(StructureWarning(
-                        code="E016",
-                        msg=f"Storage field '{field_name}' cannot use 'dict'; use TreeMap",
-                        line=node.lineno,
-                        col=node.col_offset,
-                    ))
-
-        # E017: Array size must be positive (check Array[T, Literal[N]])
-        if isinstance(annotation, ast.Subscript):
-            if isinstance(annotation.value, ast.Name) and annotation.value.id == "Array":
+            # E017: Array size must be positive (check Array[T, Literal[N]])
+            case ast.Subscript(value=ast.Name(id="Array")):
                 self._check_array_size(node, field_name, annotation)
 
-        # E018: TreeMap keys must be str
-        if isinstance(annotation, ast.Subscript):
-            if isinstance(annotation.value, ast.Name) and annotation.value.id == "TreeMap":
+            # E018: TreeMap keys must be str
+            case ast.Subscript(value=ast.Name(id="TreeMap")):
                 self._check_treemap_key(node, field_name, annotation)
 
     def _check_array_size(self, node: ast.AnnAssign, field_name: str, annotation: ast.Subscript):
@@ -227,11 +268,10 @@ class ContractStructureChecker(ast.NodeVisitor):
     def _check_treemap_key(self, node: ast.AnnAssign, field_name: str, annotation: ast.Subscript):
         """Check that TreeMap key type is Comparable (str, Address, u32, u256, etc.)."""
         # TreeMap[K: Comparable, V] - key must be a Comparable type
-        # Valid types: str, Address, u32, u256, i32, i256, bytes
-        valid_key_types = {"str", "Address", "u32", "u256", "i32", "i256", "bytes"}
+        # Valid types: see _VALID_TREEMAP_KEY_TYPES
         if isinstance(annotation.slice, ast.Tuple) and len(annotation.slice.elts) >= 1:
             key_type = annotation.slice.elts[0]
-            if isinstance(key_type, ast.Name) and key_type.id not in valid_key_types:
+            if isinstance(key_type, ast.Name) and key_type.id not in _VALID_TREEMAP_KEY_TYPES:
                 self.warnings.append(StructureWarning(
                     code="E018",
                     msg=f"TreeMap key for '{field_name}' must be Comparable (str, Address, u32, etc.), got '{key_type.id}'",
@@ -239,99 +279,31 @@ class ContractStructureChecker(ast.NodeVisitor):
                     col=node.col_offset,
                 ))
 
-    def _get_decorator_names(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> set[str]:
-        """Get all decorator names as strings."""
-        names = set()
-        for dec in node.decorator_list:
-            name = self._decorator_to_string(dec)
-            if name:
-                names.add(name)
-        return names
-
-    def _decorator_to_string(self, dec: ast.expr) -> str | None:
-        """Convert decorator AST to string like 'gl.public.view'."""
-        if isinstance(dec, ast.Name):
-            return dec.id
-        elif isinstance(dec, ast.Attribute):
-            parts = []
-            current = dec
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-                return ".".join(reversed(parts))
-        elif isinstance(dec, ast.Call):
-            return self._decorator_to_string(dec.func)
-        return None
-
-
-class StorageClassChecker(ast.NodeVisitor):
-    """Check classes used in storage for @allow_storage decorator."""
-
-    def __init__(self):
-        self.warnings: list[StructureWarning] = []
-        self.storage_classes: set[str] = set()  # Classes used in storage
-        self.allow_storage_classes: set[str] = set()  # Classes with @allow_storage
-        self.class_locations: dict[str, tuple[int, int]] = {}  # class -> (line, col)
-
-    def visit_ClassDef(self, node: ast.ClassDef):
-        # Check if has @allow_storage decorator
+    def _get_decorator_flags(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+        """Get the _DECORATOR_FLAGS bits of all recognised decorators."""
+        flags = 0
         for dec in node.decorator_list:
-            dec_name = self._decorator_to_string(dec)
-            if dec_name in ("allow_storage", "gl.allow_storage"):
-                self.allow_storage_classes.add(node.name)
-                break
-
-        self.class_locations[node.name] = (node.lineno, node.col_offset)
-
-        # Check if this is a Contract class and collect storage types
-        if self._is_contract_subclass(node):
-            for item in node.body:
-                if isinstance(item, ast.AnnAssign):
-                    self._collect_storage_types(item.annotation)
-
-        self.generic_visit(node)
-
-    def _is_contract_subclass(self, node: ast.ClassDef) -> bool:
-        return is_contract_subclass(node)
+            flags |= _DECORATOR_FLAGS.get(_decorator_to_string(dec), 0)
+        return flags
 
     def _collect_storage_types(self, annotation: ast.expr | None):
         """Collect custom class types used in storage annotations."""
-        if annotation is None:
-            return
-
-        if isinstance(annotation, ast.Name):
-            # Skip built-in and GenLayer types
-            if annotation.id not in ("str", "int", "bool", "bytes", "float",
-                                     "u256", "i256", "Address",
-                                     "DynArray", "Array", "TreeMap", "Literal"):
-                self.storage_classes.add(annotation.id)
-
-        elif isinstance(annotation, ast.Subscript):
-            # Recurse into generic types
-            self._collect_storage_types(annotation.value)
-            if isinstance(annotation.slice, ast.Tuple):
-                for elt in annotation.slice.elts:
-                    self._collect_storage_types(elt)
-            else:
-                self._collect_storage_types(annotation.slice)
-
-    def _decorator_to_string(self, dec: ast.expr) -> str | None:
-        if isinstance(dec, ast.Name):
-            return dec.id
-        elif isinstance(dec, ast.Attribute):
-            parts = []
-            current = dec
-            while isinstance(current, ast.Attribute):
-                parts.append(current.attr)
-                current = current.value
-            if isinstance(current, ast.Name):
-                parts.append(current.id)
-                return ".".join(reversed(parts))
-        elif isinstance(dec, ast.Call):
-            return self._decorator_to_string(dec.func)
-        return None
+        stack = [annotation]
+        while stack:
+            node = stack.pop()
+            t = type(node)
+            if t is ast.Name:
+                # Skip built-in and GenLayer types
+                if node.id not in _NON_CLASS_STORAGE_TYPES:
+                    self.storage_classes.add(node.id)
+
+            elif t is ast.Subscript:
+                # Descend into generic types, keeping left-to-right order
+                if type(node.slice) is ast.Tuple:
+                    stack.extend(reversed(node.slice.elts))
+                else:
+                    stack.append(node.slice)
+                stack.append(node.value)
 
     def check_missing_decorators(self) -> list[StructureWarning]:
         """Check for storage classes missing @allow_storage."""
@@ -349,12 +321,15 @@ class StorageClassChecker(ast.NodeVisitor):
         return warnings
 
 
-def check_structure(source: str | Path) -> list[StructureWarning]:
+def check_structure(
+    source: str | Path, tree: ast.Module | None = None
+) -> list[StructureWarning]:
     """
     Check contract structure (magic comment, etc).
 
     Args:
         source: Contract source code or path to contract file
+        tree: Already-parsed module for source, to skip reparsing
 
     Returns:
         List of structure warnings
@@ -366,16 +341,14 @@ def check_structure(source: str | Path) -> list[StructureWarning]:
 
     # Check for magic comment header
     # Should have # { "Seq": [...] } at the start
-    lines = source.split("\n")
-
+    # Only the leading comment block is scanned, not the whole file
+    header = _HEADER_RE.match(source)
     has_header = False
-    header_content = []
-
-    for line in lines:
-        if line.startswith("#"):
-            header_content.append(line[1:].strip() if line.startswith("# ") else line[1:])
-        else:
-            break
+    header_content = [
+        line[1:].strip() if line.startswith("# ") else line[1:]
+        for line in (header.group().split("\n") if header else ())
+        if line  # the block's trailing newline leaves one empty piece
+    ]
 
     if header_content:
         header_text = "".join(header_content)
@@ -406,16 +379,20 @@ def check_structure(source: str | Path) -> list[StructureWarning]:
                 )
             )
 
-    # AST-based checks
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    # AST-based checks all look at class definitions; without the keyword
+    # anywhere in the source there is nothing to check
+    if "class" not in source:
+        return warnings
+
+    if tree is None:
+        tree = parse_cached(source)
+    if tree is None:
         # Syntax errors are handled elsewhere
         return warnings
 
     # Contract structure checks
     structure_checker = ContractStructureChecker()
-    structure_checker.visit(tree)
+    structure_checker.run(tree)
     warnings.extend(structure_checker.warnings)
 
     # E011: Single contract per module
@@ -431,8 +408,6 @@ def check_structure(source: str | Path) -> list[StructureWarning]:
             )
 
     # Storage class checks
-    storage_checker = StorageClassChecker()
-    storage_checker.visit(tree)
-    warnings.extend(storage_checker.check_missing_decorators())
+    warnings.extend(structure_checker.check_missing_decorators())
 
     return warnings
@@ -4,10 +4,17 @@ Backwards-compatible linter API for studio integration.
 Wraps the new lint/validate modules with the old GenVMLinter interface.
 """
 
+import ast
+import functools
+import hashlib
+import os
+from collections import OrderedDict
+from dataclasses import asdict, replace
 from pathlib import Path
 from typing import List, Optional, Union
 
 from .rules import Severity, ValidationResult
+from .lint import cache
 from .lint.safety import check_safety
 from .lint.structure import check_structure
 
@@ -19,9 +26,20 @@ class GenVMLinter:
     Uses fast AST-based checks from lint module.
     """
 
-    def __init__(self):
-        """Initialize the linter."""
-        pass
+    # Number of distinct (source, filename) results kept for re-lints
+    _CACHE_MAX = 32
+
+    def __init__(self, use_disk_cache: bool = False):
+        """Initialize the linter.
+
+        Args:
+            use_disk_cache: Keep lint_file results in the on-disk lint cache,
+                so files unchanged since an earlier run are not re-linted
+        """
+        self._use_disk_cache = use_disk_cache
+        self._cache: OrderedDict[tuple[str, Optional[str]], List[ValidationResult]] = (
+            OrderedDict()
+        )
 
     def lint_file(self, filepath: Union[str, Path]) -> List[ValidationResult]:
         """Lint a single Python file.
@@ -32,35 +50,42 @@ class GenVMLinter:
         Returns:
             List of validation results
         """
-        filepath = Path(filepath)
+        path = os.fspath(filepath)
 
-        if not filepath.exists():
+        if not os.path.exists(path):
             return [
                 ValidationResult(
                     rule_id="E100",
-                    message=f"File not found: {filepath}",
+                    message=f"File not found: {path}",
                     severity=Severity.ERROR,
                     line=1,
                     column=0,
-                    filename=str(filepath),
+                    filename=path,
                 )
             ]
 
         try:
-            source_code = filepath.read_text(encoding="utf-8")
+            with open(path, "rb") as f:
+                data = f.read()
         except Exception as e:
-            return [
-                ValidationResult(
-                    rule_id="E101",
-                    message=f"Error reading file: {e}",
-                    severity=Severity.ERROR,
-                    line=1,
-                    column=0,
-                    filename=str(filepath),
-                )
-            ]
+            return [_read_error(path, e)]
+
+        key = None
+        if self._use_disk_cache:
+            key = _disk_cache_key(path, data)
+            cached = cache.get(key)
+            if cached is not None:
+                return [_result_from_dict(r) for r in cached["results"]]
+
+        try:
+            source_code = _decode_source(data)
+        except UnicodeDecodeError as e:
+            return [_read_error(path, e)]
 
-        return self.lint_source(source_code, str(filepath))
+        results = self.lint_source(source_code, path)
+        if key is not None:
+            cache.put(key, {"results": [_result_to_dict(r) for r in results]})
+        return results
 
     def lint_source(
         self, source_code: str, filename: Optional[str] = None
@@ -74,15 +99,30 @@ class GenVMLinter:
         Returns:
             List of validation results
         """
-        results: List[ValidationResult] = []
+        # Studios re-lint the same buffer repeatedly; serve unchanged ones
+        # from a small LRU cache. str hashes are cached, so the source itself
+        # is a cheap key.
+        key = (source_code, filename)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        else:
+            cached = self._lint_source(source_code, filename)
+            self._cache[key] = cached
+            if len(self._cache) > self._CACHE_MAX:
+                self._cache.popitem(last=False)
+        # Copies, so callers can't alter the cached results
+        return [replace(result) for result in cached]
 
+    def _lint_source(
+        self, source_code: str, filename: Optional[str]
+    ) -> List[ValidationResult]:
+        """Lint source_code without consulting the result cache."""
         # Syntax check first
         try:
-            import ast
-
-            ast.parse(source_code)
+            tree = ast.parse(source_code)
         except SyntaxError as e:
-            results.append(
+            return [
                 ValidationResult(
                     rule_id="E001",
                     message=f"Syntax error: {e.msg}",
@@ -92,79 +132,130 @@ class GenVMLinter:
                     filename=filename,
                     suggestion="Fix the syntax error before other checks can run.",
                 )
-            )
-            return results  # Can't continue with syntax errors
-
-        # Safety checks (forbidden imports, non-determinism)
-        safety_warnings = check_safety(source_code)
-        for w in safety_warnings:
-            severity = Severity.ERROR if (
-                w.code.startswith("E")
-                or w.code == "GL-S03"
-            ) else Severity.WARNING
-            results.append(
-                ValidationResult(
-                    rule_id=w.code,
-                    message=w.msg,
-                    severity=severity,
-                    line=w.line,
-                    column=w.col,
-                    filename=filename,
-                    suggestion=_get_suggestion(w.code),
-                )
-            )
+            ]  # Can't continue with syntax errors
 
-        # Structure checks (contract class, decorators)
-        structure_warnings = check_structure(source_code)
-        for w in structure_warnings:
-            severity = Severity.ERROR if (
-                w.code.startswith("E") or w.code == "GL-S03"
-            ) else Severity.WARNING
-            results.append(
-                ValidationResult(
-                    rule_id=w.code,
-                    message=w.msg,
-                    severity=severity,
-                    line=w.line,
-                    column=w.col,
-                    filename=filename,
-                    suggestion=_get_suggestion(w.code),
-                )
+        return self.lint_ast(tree, source_code, filename)
+
+    def lint_ast(
+        self, tree: ast.Module, source_code: str, filename: Optional[str] = None
+    ) -> List[ValidationResult]:
+        """Lint an already-parsed module, skipping the parser pass.
+
+        Args:
+            tree: Module parsed from source_code
+            source_code: Python source code the tree was parsed from
+                (needed for the dependency header checks)
+            filename: Optional filename for error reporting
+
+        Returns:
+            List of validation results
+        """
+        # Safety checks (forbidden imports, non-determinism), then structure
+        # checks (contract class, decorators)
+        warnings = check_safety(source_code, tree) + check_structure(source_code, tree)
+        return [
+            ValidationResult(
+                rule_id=w.code,
+                message=w.msg,
+                severity=(
+                    Severity.ERROR
+                    if w.code[0] == "E" or w.code == "GL-S03"
+                    else Severity.WARNING
+                ),
+                line=w.line,
+                column=w.col,
+                filename=filename,
+                suggestion=_SUGGESTIONS.get(w.code),
             )
+            for w in warnings
+        ]
 
-        return results
+
+# Prefix for ValidationResult lists in the shared lint cache; keys of
+# lint_contract_cached's LintResult dicts are bare hex digests
+_DISK_CACHE_PREFIX = "results-"
+
+
+@functools.lru_cache(maxsize=1)
+def _results_fingerprint() -> bytes:
+    """Digest the lint rules plus the modules that turn warnings into results."""
+    digest = hashlib.blake2b(cache._rules_fingerprint())
+    for module in (Path(__file__), Path(__file__).parent / "rules" / "__init__.py"):
+        digest.update(module.read_bytes())
+    return digest.digest()
+
+
+def _disk_cache_key(path: str, data: bytes) -> str:
+    """Key lint_file results by file path and raw bytes.
+
+    Keyed by the raw bytes, so hits skip decoding as well. Results carry the
+    filename, so it is part of the key.
+    """
+    digest = hashlib.blake2b(os.fsencode(path) + b"\0" + data + _results_fingerprint())
+    return _DISK_CACHE_PREFIX + digest.hexdigest()
+
+
+def _decode_source(data: bytes) -> str:
+    """Decode file contents as open(path, encoding="utf-8").read() would."""
+    source = data.decode("utf-8")
+    if "\r" in source:
+        # Universal newlines, as in text mode
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+
+def _read_error(path: str, error: Exception) -> ValidationResult:
+    """Build the E101 result for a file that could not be read."""
+    return ValidationResult(
+        rule_id="E101",
+        message=f"Error reading file: {error}",
+        severity=Severity.ERROR,
+        line=1,
+        column=0,
+        filename=path,
+    )
+
+
+def _result_to_dict(result: ValidationResult) -> dict:
+    """Convert a result to a JSON-serializable dict for the disk cache."""
+    data = asdict(result)
+    data["severity"] = result.severity.value
+    return data
+
+
+def _result_from_dict(data: dict) -> ValidationResult:
+    """Rebuild a result from the output of _result_to_dict."""
+    return ValidationResult(**{**data, "severity": Severity(data["severity"])})
 
 
-def _get_suggestion(code: str) -> Optional[str]:
-    """Get suggestion text for a warning code."""
-    suggestions = {
-        "W001": "Remove the forbidden import. Use GenLayer SDK equivalents instead.",
-        "W002": "Use deterministic alternatives from the GenLayer SDK.",
-        "W010": "Add contract header: # { \"Seq\": [{ \"Depends\": \"py-genlayer:...\" }] }",
-        "W011": "Add py-genlayer dependency to contract header.",
-        "E010": "Wrap gl.nondet.* calls in gl.eq_principle.* or gl.vm.run_nondet() for consensus.",
-        "E011": "Move each contract class to its own file.",
-        "E012": "Remove @gl.public decorator from __init__ method.",
-        "E013": "Rename method to not start with '__' or make it private.",
-        "E014": "Add @allow_storage decorator to the class.",
-        "E015": "Use u256 or i256 instead of int for storage fields.",
-        "E016": "Use DynArray instead of list, TreeMap instead of dict.",
-        "E017": "Array size must be a positive integer Literal.",
-        "E018": "TreeMap keys must be Comparable (str, Address, u32, u256, etc.).",
-        "E019": "Add the required decorator for this special method.",
-        "W020": "Add return type annotation to view method for schema generation.",
-        "E021": "Remove *args/**kwargs from public method signature.",
-        "E022": "Add 'self' as first parameter.",
-        "E023": "Move .emit() call outside the leader/validator function. Message emission cannot happen inside non-deterministic contexts.",
-        "E024": "Move contract call outside the leader/validator function. Inter-contract calls cannot happen inside non-deterministic contexts.",
-        "E025": "Cannot nest run_nondet/eq_principle inside a non-deterministic block.",
-        "E026": "Move storage write outside the leader/validator function. Storage writes cannot happen inside non-deterministic contexts.",
-        "GL-S03": (
-            "Replace eq_principle_strict_eq with eq_principle_prompt_comparative "
-            "or eq_principle_prompt_non_comparative for LLM/web outputs."
-        ),
-    }
-    return suggestions.get(code)
+# Suggestion text per warning code
+_SUGGESTIONS = {
+    "W001": "Remove the forbidden import. Use GenLayer SDK equivalents instead.",
+    "W002": "Use deterministic alternatives from the GenLayer SDK.",
+    "W010": "Add contract header: # { \"Seq\": [{ \"Depends\": \"py-genlayer:...\" }] }",
+    "W011": "Add py-genlayer dependency to contract header.",
+    "E010": "Wrap gl.nondet.* calls in gl.eq_principle.* or gl.vm.run_nondet() for consensus.",
+    "E011": "Move each contract class to its own file.",
+    "E012": "Remove @gl.public decorator from __init__ method.",
+    "E013": "Rename method to not start with '__' or make it private.",
+    "E014": "Add @allow_storage decorator to the class.",
+    "E015": "Use u256 or i256 instead of int for storage fields.",
+    "E016": "Use DynArray instead of list, TreeMap instead of dict.",
+    "E017": "Array size must be a positive integer Literal.",
+    "E018": "TreeMap keys must be Comparable (str, Address, u32, u256, etc.).",
+    "E019": "Add the required decorator for this special method.",
+    "W020": "Add return type annotation to view method for schema generation.",
+    "E021": "Remove *args/**kwargs from public method signature.",
+    "E022": "Add 'self' as first parameter.",
+    "E023": "Move .emit() call outside the leader/validator function. Message emission cannot happen inside non-deterministic contexts.",
+    "E024": "Move contract call outside the leader/validator function. Inter-contract calls cannot happen inside non-deterministic contexts.",
+    "E025": "Cannot nest run_nondet/eq_principle inside a non-deterministic block.",
+    "E026": "Move storage write outside the leader/validator function. Storage writes cannot happen inside non-deterministic contexts.",
+    "GL-S03": (
+        "Replace eq_principle_strict_eq with eq_principle_prompt_comparative "
+        "or eq_principle_prompt_non_comparative for LLM/web outputs."
+    ),
+}
 
 
 __all__ = ["GenVMLinter"]
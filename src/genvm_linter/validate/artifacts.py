@@ -1,8 +1,10 @@
 """Download and cache GenVM release artifacts."""
 
+import functools
 import json
 import os
 import re
+import shutil
 import sys
 import tarfile
 import tempfile
@@ -81,9 +83,13 @@ def get_latest_version() -> str:
     return FALLBACK_VERSION
 
 
+_VERSION_NUMBER_RE = re.compile(r"\d+")
+
+
+@functools.lru_cache(maxsize=256)
 def _version_sort_key(version: str) -> tuple[int, ...]:
     """Numeric-component sort key so v0.2.16 ranks above v0.2.9."""
-    return tuple(int(n) for n in re.findall(r"\d+", version))
+    return tuple(map(int, _VERSION_NUMBER_RE.findall(version)))
 
 
 def _cache_repo_slug() -> str:
@@ -117,12 +123,13 @@ def list_cached_versions() -> list[str]:
     ignored: they predate the genvm -> genvm-manager split and are exactly
     the bundles that must not be reused.
     """
-    cache_dir = get_cache_dir()
     prefix = _cache_prefix()
     versions = []
-    for f in cache_dir.glob(f"{prefix}*.tar.xz"):
-        version = f.name[len(prefix) :].replace(".tar.xz", "")
-        versions.append(version)
+    with os.scandir(get_cache_dir()) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".tar.xz"):
+                versions.append(name[len(prefix) : -len(".tar.xz")])
     return sorted(versions, key=_version_sort_key, reverse=True)
 
 
@@ -453,8 +460,6 @@ def extract_runner(artifact_path: Path, runner_type: str, hash_val: str) -> Path
         return runner_path
     except Exception:
         if runner_path.exists():
-            import shutil
-
             shutil.rmtree(runner_path)
         raise
 
@@ -475,12 +480,16 @@ def parse_runner_manifest(runner_path: Path) -> dict[str, str]:
     return deps
 
 
+# Cache subdirectories holding lint and typecheck results
+_RESULT_CACHE_DIRS = ("lint", "typecheck")
+
+
 def clean_cache(
     keep_versions: list[str] | None = None,
     keep_latest: bool = True,
 ) -> tuple[int, int]:
     """
-    Clean cached GenVM artifacts.
+    Clean cached GenVM artifacts, plus all cached lint/typecheck results.
 
     Args:
         keep_versions: List of versions to keep (e.g., ["v0.2.12"])
@@ -489,8 +498,6 @@ def clean_cache(
     Returns:
         Tuple of (files_deleted, bytes_freed)
     """
-    import shutil
-
     keep = set(keep_versions or [])
     if keep_latest:
         try:
@@ -501,41 +508,76 @@ def clean_cache(
 
     files_deleted = 0
     bytes_freed = 0
+    cache_dir = get_cache_dir()
 
     # Clean tarballs
-    for f in get_cache_dir().glob(f"{_cache_prefix()}*.tar.xz"):
-        version = _cached_bundle_version(f)
-        if version not in keep:
-            bytes_freed += f.stat().st_size
-            f.unlink()
-            files_deleted += 1
+    prefix = _cache_prefix()
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(".tar.xz")):
+                continue
+            if name[len(prefix) : -len(".tar.xz")] not in keep:
+                bytes_freed += entry.stat().st_size
+                os.unlink(entry.path)
+                files_deleted += 1
+
+    def remove_tree(path: str) -> None:
+        nonlocal files_deleted, bytes_freed
+        count, size = _tree_usage(path)
+        files_deleted += count
+        bytes_freed += size
+        shutil.rmtree(path)
 
     # Clean extracted directories
-    extracted_dir = get_cache_dir() / "extracted"
+    extracted_dir = cache_dir / "extracted"
     if extracted_dir.exists():
         kept_namespaces = {_extracted_namespace(version) for version in keep}
         current_namespace_prefix = f"{_cache_repo_slug()}-"
-        for d in extracted_dir.iterdir():
-            if (
-                d.is_dir()
-                and d.name.startswith(current_namespace_prefix)
-                and d.name not in kept_namespaces
-            ):
-                for f in d.rglob("*"):
-                    if f.is_file():
-                        bytes_freed += f.stat().st_size
-                        files_deleted += 1
-                shutil.rmtree(d)
+        with os.scandir(extracted_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.is_dir()
+                    and entry.name.startswith(current_namespace_prefix)
+                    and entry.name not in kept_namespaces
+                ):
+                    remove_tree(entry.path)
 
     # Clean stubs
-    stubs_dir = get_cache_dir() / "stubs"
+    stubs_dir = cache_dir / "stubs"
     if stubs_dir.exists():
-        for d in stubs_dir.iterdir():
-            if d.is_dir() and d.name not in keep:
-                for f in d.rglob("*"):
-                    if f.is_file():
-                        bytes_freed += f.stat().st_size
-                        files_deleted += 1
-                shutil.rmtree(d)
+        with os.scandir(stubs_dir) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name not in keep:
+                    remove_tree(entry.path)
+
+    # Clean lint/typecheck results and generated pyright configs; they are
+    # not tied to a version and are rebuilt on demand
+    for name in _RESULT_CACHE_DIRS:
+        results_dir = cache_dir / name
+        if results_dir.exists():
+            remove_tree(str(results_dir))
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("pyright-") and entry.name.endswith(".json"):
+                bytes_freed += entry.stat().st_size
+                os.unlink(entry.path)
+                files_deleted += 1
 
     return files_deleted, bytes_freed
+
+
+def _tree_usage(path: str) -> tuple[int, int]:
+    """Count regular files and their total size under a directory."""
+    files = 0
+    size = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    files += 1
+                    size += entry.stat(follow_symlinks=False).st_size
+    return files, size
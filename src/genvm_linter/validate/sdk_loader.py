@@ -1,12 +1,13 @@
 """Load GenLayer SDK for contract validation."""
 
+import contextlib
+import functools
 import importlib.util
 import os
 import re
 import sys
 from pathlib import Path
-from typing import Any, Callable
-from unittest.mock import MagicMock
+from typing import Any, Callable, Iterator
 
 from .artifacts import (
     GITHUB_RELEASES_URL,
@@ -16,6 +17,8 @@ from .artifacts import (
     resolve_artifact_source,
 )
 
+_DEPENDS_RE = re.compile(r'"Depends":\s*"([^:]+):([^"]+)"')
+
 
 def parse_contract_header(contract_path: Path) -> dict[str, str]:
     """
@@ -28,26 +31,38 @@ def parse_contract_header(contract_path: Path) -> dict[str, str]:
     #     { "Depends": "py-genlayer:HASH" }
     #   ]
     # }
+
+    Results are memoized per (path, mtime, size), so repeated lookups of an
+    unchanged contract in one process do not touch its contents again.
     """
-    content = contract_path.read_text()
+    stat = os.stat(contract_path)
+    header = _parse_contract_header(os.path.abspath(contract_path), stat.st_mtime_ns, stat.st_size)
+    return dict(header)
 
+
+@functools.lru_cache(maxsize=256)
+def _parse_contract_header(
+    contract_path: str, _mtime_ns: int, _size: int
+) -> tuple[tuple[str, str], ...]:
+    # Only the leading comment block is read; the contract body is never loaded
     header_lines = []
-    for line in content.split("\n"):
-        if line.startswith("#"):
+    with open(contract_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line.startswith("#"):
+                break
             header_lines.append(line[1:].strip() if line.startswith("# ") else line[1:])
-        else:
-            break
 
     header_text = "\n".join(header_lines)
 
-    depends_pattern = r'"Depends":\s*"([^:]+):([^"]+)"'
-    matches = re.findall(depends_pattern, header_text)
-
-    return {name: hash_val for name, hash_val in matches}
+    return tuple(_DEPENDS_RE.findall(header_text))
 
 
 def setup_wasi_mocks():
     """Mock the _genlayer_wasi module."""
+    # unittest.mock pulls in asyncio; only pay for it when validating
+    from unittest.mock import MagicMock
+
     wasi_mock = MagicMock()
     wasi_mock.storage_read = MagicMock(return_value=None)
     wasi_mock.storage_write = MagicMock(return_value=None)
@@ -65,6 +80,39 @@ def extract_sdk_paths(
     """
     Extract SDK components needed for the contract.
 
+    Results are memoized per (artifact, mtime, dependencies) so repeated
+    calls in one process skip the runner index lookups entirely.
+
+    Returns:
+        Tuple of (sdk_paths, upgrade_notes).
+    """
+    tarball_path = Path(tarball_path)
+    key = (str(tarball_path), tarball_path.stat().st_mtime_ns, tuple(sorted(dependencies.items())))
+    paths, notes = _extract_sdk_paths_memo(*key)
+    if not all(path.exists() for path in paths):
+        # Extracted runners were removed (e.g. cache clean); redo the extraction
+        _extract_sdk_paths_memo.cache_clear()
+        paths, notes = _extract_sdk_paths_memo(*key)
+    return list(paths), list(notes)
+
+
+@functools.lru_cache(maxsize=32)
+def _extract_sdk_paths_memo(
+    tarball_path: str,
+    _mtime_ns: int,
+    dependencies: tuple[tuple[str, str], ...],
+) -> tuple[tuple[Path, ...], tuple[str, ...]]:
+    paths, notes = _extract_sdk_paths(Path(tarball_path), dict(dependencies))
+    return tuple(paths), tuple(notes)
+
+
+def _extract_sdk_paths(
+    tarball_path: Path,
+    dependencies: dict[str, str],
+) -> tuple[list[Path], list[str]]:
+    """
+    Extract SDK components needed for the contract.
+
     Opens the tarball once and performs all extractions / lookups
     through a single decompression pass.
 
@@ -128,6 +176,58 @@ def extract_sdk_paths(
     return paths, notes
 
 
+class SdkContext:
+    """Resolved GenVM artifacts and SDK paths shared across one invocation.
+
+    Resolving the artifact source can hit the network (latest release
+    lookup, bundle download), so it happens at most once per context, and
+    SDK paths are remembered per dependency set.
+    """
+
+    def __init__(self, version: str | None = None):
+        self.version = version
+        self._artifact_path: Path | None = None
+        self._sdk_paths: dict[tuple[tuple[str, str], ...], tuple[list[Path], list[str]]] = {}
+
+    def artifact_path(
+        self,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> Path:
+        """Resolve the prebuilt tree or release bundle, once."""
+        if self._artifact_path is None:
+            self._artifact_path = resolve_artifact_source(
+                self.version, progress_callback=progress_callback
+            )
+        return self._artifact_path
+
+    def sdk_paths(
+        self,
+        dependencies: dict[str, str],
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> tuple[list[Path], list[str]]:
+        """Return (sdk_paths, upgrade_notes) for a contract's dependencies."""
+        key = tuple(sorted(dependencies.items()))
+        if key not in self._sdk_paths:
+            self._sdk_paths[key] = extract_sdk_paths(
+                self.artifact_path(progress_callback), dependencies
+            )
+        paths, notes = self._sdk_paths[key]
+        return list(paths), list(notes)
+
+    def extra_paths(
+        self,
+        dependencies: dict[str, str],
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> list[str]:
+        """Return the SDK source directories to import from."""
+        sdk_paths, _notes = self.sdk_paths(dependencies, progress_callback)
+        return [str(_src_dir(path)) for path in sdk_paths]
+
+
+def _src_dir(path: Path) -> Path:
+    return path / "src" if (path / "src").exists() else path
+
+
 def _import_get_schema() -> Callable[[type], dict[str, Any]]:
     """Import get_schema from the current SDK or its legacy location."""
     try:
@@ -142,6 +242,7 @@ def _import_get_schema() -> Callable[[type], dict[str, Any]]:
 def load_sdk(
     contract_path: Path,
     progress_callback: Callable[[int, int], None] | None = None,
+    sdk_ctx: SdkContext | None = None,
 ) -> tuple[Callable[[type], dict[str, Any]], list[str]]:
     """
     Load GenLayer SDK for contract validation.
@@ -149,6 +250,7 @@ def load_sdk(
     Args:
         contract_path: Path to the contract file
         progress_callback: Optional callback for download progress
+        sdk_ctx: Shared SDK context; a fresh one is used when omitted
 
     Returns:
         Tuple of (get_schema function, upgrade_notes list)
@@ -167,23 +269,51 @@ def load_sdk(
     # 3. Parse contract header for runner hashes
     dependencies = parse_contract_header(contract_path)
 
-    # 4. Resolve a prebuilt tree or download a release bundle
-    artifact_path = resolve_artifact_source(progress_callback=progress_callback)
+    # 4. Resolve a prebuilt tree or download a release bundle, then extract
+    #    SDK paths from the selected source
+    if sdk_ctx is None:
+        sdk_ctx = SdkContext()
+    sdk_paths, upgrade_notes = sdk_ctx.sdk_paths(dependencies, progress_callback)
 
-    # 5. Extract SDK paths from the selected source
-    sdk_paths, upgrade_notes = extract_sdk_paths(artifact_path, dependencies)
-
-    # 6. Add SDK to path
+    # 5. Add SDK to path
     for path in reversed(sdk_paths):
-        src_path = path / "src" if (path / "src").exists() else path
-        sys.path.insert(0, str(src_path))
+        sys.path.insert(0, str(_src_dir(path)))
 
-    # 7. Import get_schema from the current SDK, falling back to the legacy layout.
+    # 6. Import get_schema from the current SDK, falling back to the legacy layout.
     get_schema = _import_get_schema()
 
     return get_schema, upgrade_notes
 
 
+@contextlib.contextmanager
+def isolated_sdk_imports() -> Iterator[None]:
+    """Undo the sys.path and sys.modules changes of load_sdk on exit.
+
+    load_sdk puts the contract's SDK on sys.path and imports it, and
+    load_contract_module registers the contract as "contract". Both are
+    undone here, so the next contract validated in this process imports the
+    SDK its own header pins rather than reusing the previous one.
+    """
+    saved_path = list(sys.path)
+    try:
+        yield
+    finally:
+        added = tuple(os.path.join(p, "") for p in sys.path if p not in saved_path)
+        sys.path[:] = saved_path
+        for name, module in list(sys.modules.items()):
+            if name == "contract" or (added and _loaded_from(module, added)):
+                del sys.modules[name]
+
+
+def _loaded_from(module, roots: tuple[str, ...]) -> bool:
+    """Whether a module (or namespace package) was imported from beneath roots."""
+    locations = [getattr(module, "__file__", None)]
+    spec = getattr(module, "__spec__", None)
+    if spec is not None and spec.submodule_search_locations:
+        locations.extend(spec.submodule_search_locations)
+    return any(location and location.startswith(roots) for location in locations)
+
+
 def load_contract_module(contract_path: Path):
     """Load contract as a Python module."""
     spec = importlib.util.spec_from_file_location("contract", contract_path)
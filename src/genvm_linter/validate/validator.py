@@ -1,10 +1,20 @@
 """Contract validation using SDK reflection."""
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
-from .sdk_loader import find_contract_class, load_contract_module, load_sdk
+from .sdk_loader import (
+    SdkContext,
+    find_contract_class,
+    isolated_sdk_imports,
+    load_contract_module,
+    load_sdk,
+)
+
+# Location embedded in SDK schema TypeErrors, e.g. "... {'line': 12, ...}"
+_ERROR_LINE_RE = re.compile(r"'line':\s*(\d+)")
 
 
 @dataclass
@@ -44,6 +54,7 @@ def validate_contract(
     contract_path: Path | str,
     progress_callback: Callable[[int, int], None] | None = None,
     soften_sdk_warnings: bool = False,
+    sdk_ctx: SdkContext | None = None,
 ) -> ValidationResult:
     """
     Validate a GenLayer contract using SDK reflection.
@@ -53,6 +64,7 @@ def validate_contract(
         progress_callback: Optional callback for download progress
         soften_sdk_warnings: If True, known non-critical SDK type hints are surfaced
             as warnings instead of hard validation failures.
+        sdk_ctx: Shared SDK context, so artifacts are resolved once per invocation
 
     Returns:
         ValidationResult with schema or errors
@@ -65,9 +77,21 @@ def validate_contract(
             errors=[{"code": "E100", "msg": f"Contract not found: {contract_path}"}],
         )
 
+    # Contracts may pin different SDKs; don't leave this one's imported for the next
+    with isolated_sdk_imports():
+        return _validate_contract(contract_path, progress_callback, soften_sdk_warnings, sdk_ctx)
+
+
+def _validate_contract(
+    contract_path: Path,
+    progress_callback: Callable[[int, int], None] | None,
+    soften_sdk_warnings: bool,
+    sdk_ctx: SdkContext | None,
+) -> ValidationResult:
+    """Validate an existing contract file (see validate_contract)."""
     # Load SDK
     try:
-        get_schema, upgrade_notes = load_sdk(contract_path, progress_callback)
+        get_schema, upgrade_notes = load_sdk(contract_path, progress_callback, sdk_ctx)
     except Exception as e:
         return ValidationResult(
             ok=False,
@@ -117,9 +141,7 @@ def validate_contract(
 
         # Try to extract line number from error
         if "line" in error_msg:
-            import re
-
-            match = re.search(r"'line':\s*(\d+)", error_msg)
+            match = _ERROR_LINE_RE.search(error_msg)
             if match:
                 error["line"] = int(match.group(1))
 
@@ -419,6 +419,18 @@ class TestCleanCacheNamespacing:
         assert foreign_bundle.exists()
         assert foreign_dir.exists()
 
+    def test_removes_lint_and_typecheck_results(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(artifacts, "get_cache_dir", lambda: tmp_path)
+        for name in ("lint", "typecheck"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "entry.json").write_text("{}")
+        (tmp_path / "pyright-0123456789abcdef.json").write_text("{}")
+
+        files_deleted, _ = artifacts.clean_cache(keep_latest=False)
+
+        assert files_deleted == 3
+        assert list(tmp_path.iterdir()) == []
+
 
 class TestNoBundledReleaseWarning:
     def test_warns_when_no_release_ships_a_bundle(self, monkeypatch, capsys):
@@ -0,0 +1,226 @@
+"""CLI tests for multi-contract commands."""
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from genvm_linter import cli
+from genvm_linter.validate import sdk_loader
+
+
+def _write_fake_sdk(root: Path, methods: int) -> Path:
+    """Write a minimal SDK whose get_schema reports `methods` methods."""
+    package = root / "src" / "genlayer"
+    (package / "py").mkdir(parents=True)
+    (package / "__init__.py").write_text(f"class Contract:\n    pass\n\nMETHODS = {methods}\n")
+    (package / "py" / "__init__.py").write_text("")
+    (package / "py" / "get_schema.py").write_text(
+        "from genlayer import METHODS\n\n"
+        "def get_schema(contract):\n"
+        '    return {"methods": {f"m{i}": {} for i in range(METHODS)}}\n'
+    )
+    return root
+
+
+def _write_contract(path: Path, sdk_hash: str) -> Path:
+    path.write_text(
+        f'# {{ "Depends": "py-genlayer:{sdk_hash}" }}\n'
+        "from genlayer import *\n\n"
+        "class Stored(Contract):\n"
+        "    pass\n"
+    )
+    return path
+
+
+def _use_fake_sdks(monkeypatch, tmp_path: Path) -> dict[str, Path]:
+    """Resolve py-genlayer hashes "aaaa" and "bbbb" to two different fake SDKs."""
+    sdks = {
+        "aaaa": _write_fake_sdk(tmp_path / "sdk-a", methods=1),
+        "bbbb": _write_fake_sdk(tmp_path / "sdk-b", methods=2),
+    }
+    monkeypatch.setattr(sdk_loader, "resolve_artifact_source", lambda *a, **k: tmp_path)
+    monkeypatch.setattr(
+        sdk_loader,
+        "extract_sdk_paths",
+        lambda _artifact, deps: ([sdks[deps["py-genlayer"]]], []),
+    )
+    return sdks
+
+
+def test_check_validates_each_contract_against_its_own_sdk(monkeypatch, tmp_path):
+    _use_fake_sdks(monkeypatch, tmp_path)
+    first = _write_contract(tmp_path / "first.py", "aaaa")
+    second = _write_contract(tmp_path / "second.py", "bbbb")
+    path_before = list(sys.path)
+
+    result = CliRunner().invoke(
+        cli.main, ["check", str(first), str(second), "--json", "--no-cache"]
+    )
+
+    files = json.loads(result.output)["files"]
+    assert [f["validate"]["methods"] for f in files] == [1, 2]
+    assert sys.path == path_before
+    assert "genlayer" not in sys.modules
+    assert "contract" not in sys.modules
+
+
+class _FakePyright:
+    """Stand-in for subprocess.run that reports one error per checked file."""
+
+    def __init__(self):
+        self.runs: list[list[str]] = []
+
+    def __call__(self, args, **kwargs):
+        config = json.loads(Path(args[args.index("--project") + 1]).read_text())
+        files = args[args.index("--project") + 2 : args.index("--outputjson")]
+        self.runs.append(files)
+        diagnostics = [
+            {
+                "file": file,
+                "severity": "error",
+                "message": f"checked with {config['extraPaths'][0]}",
+                "range": {"start": {"line": 0}},
+            }
+            for file in files
+        ]
+        stdout = json.dumps({"generalDiagnostics": diagnostics})
+        return subprocess.CompletedProcess(args, 1, stdout=stdout, stderr="")
+
+
+def _typecheck(monkeypatch, tmp_path, *contracts: Path, pyright=None) -> dict:
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(exist_ok=True)
+    monkeypatch.setattr(cli, "get_cache_dir", lambda: cache_dir)
+    monkeypatch.setattr(subprocess, "run", pyright or _FakePyright())
+    result = CliRunner().invoke(cli.main, ["typecheck", *map(str, contracts), "--json"])
+    return json.loads(result.output)
+
+
+class TestTypecheck:
+    def test_each_dependency_group_gets_its_own_diagnostics(self, monkeypatch, tmp_path):
+        sdks = _use_fake_sdks(monkeypatch, tmp_path)
+        first = _write_contract(tmp_path / "first.py", "aaaa")
+        second = _write_contract(tmp_path / "second.py", "bbbb")
+        pyright = _FakePyright()
+
+        output = _typecheck(monkeypatch, tmp_path, first, second, pyright=pyright)
+
+        assert len(pyright.runs) == 2
+        for contract, sdk in ((first, sdks["aaaa"]), (second, sdks["bbbb"])):
+            (diagnostic,) = output["files"][str(contract)]["diagnostics"]
+            assert diagnostic["message"] == f"checked with {sdk / 'src'}"
+
+    def test_unchanged_contract_skips_pyright(self, monkeypatch, tmp_path):
+        _use_fake_sdks(monkeypatch, tmp_path)
+        contract = _write_contract(tmp_path / "contract.py", "aaaa")
+        first = _typecheck(monkeypatch, tmp_path, contract)
+
+        def _fail_run(*args, **kwargs):
+            raise AssertionError("an unchanged contract must not be re-checked")
+
+        second = _typecheck(monkeypatch, tmp_path, contract, pyright=_fail_run)
+
+        assert second == first
+        assert second["summary"]["errors"] == 1
+
+    def test_paths_naming_the_same_file_share_diagnostics(self, monkeypatch, tmp_path):
+        _use_fake_sdks(monkeypatch, tmp_path)
+        contract = _write_contract(tmp_path / "contract.py", "aaaa")
+        link = tmp_path / "link.py"
+        link.symlink_to(contract)
+        pyright = _FakePyright()
+
+        output = _typecheck(monkeypatch, tmp_path, contract, link, contract, pyright=pyright)
+
+        assert pyright.runs == [[str(contract)]]
+        assert list(output["files"]) == [str(contract), str(link)]
+        assert all(len(f["diagnostics"]) == 1 for f in output["files"].values())
+
+    def test_watch_hands_the_group_to_one_pyright_process(self, monkeypatch, tmp_path):
+        _use_fake_sdks(monkeypatch, tmp_path)
+        contract = _write_contract(tmp_path / "contract.py", "aaaa")
+        monkeypatch.setattr(cli, "get_cache_dir", lambda: tmp_path)
+        calls = []
+
+        def _watch(args, **kwargs):
+            calls.append(args)
+            return subprocess.CompletedProcess(args, 0)
+
+        monkeypatch.setattr(subprocess, "run", _watch)
+        result = CliRunner().invoke(cli.main, ["typecheck", str(contract), "--watch"])
+
+        assert result.exit_code == 0
+        ((*_, checked, flag),) = calls
+        assert (checked, flag) == (str(contract), "--watch")
+
+
+def test_download_reports_each_version_and_fails_if_any_failed(monkeypatch, tmp_path):
+    # v1 and v3 only finish once both are in flight, so the downloads must overlap
+    overlap = threading.Barrier(2, timeout=5)
+
+    def _download(version, progress_callback=None):
+        assert progress_callback is None  # per-chunk progress would interleave
+        if version == "v2":
+            raise RuntimeError("asset not found")
+        overlap.wait()
+        return tmp_path / f"{version}.tar.xz"
+
+    monkeypatch.setattr(cli, "download_artifacts", _download)
+    result = CliRunner().invoke(cli.main, ["download", "-v", "v1", "-v", "v2", "-v", "v3"])
+
+    assert result.exit_code == 3
+    lines = result.output.splitlines()
+    assert lines[0] == "Downloading GenVM v1, v2, v3..."
+    assert sorted(lines[1:]) == [
+        f"✓ v1 downloaded to {tmp_path / 'v1.tar.xz'}",
+        f"✓ v3 downloaded to {tmp_path / 'v3.tar.xz'}",
+        "✗ v2 download failed: asset not found",
+    ]
+
+
+def test_directory_arguments_skip_hidden_and_cache_directories(tmp_path):
+    for relative in (
+        "contract.py",
+        "pkg/other.py",
+        ".venv/lib/site.py",
+        ".git/hooks/hook.py",
+        "pkg/__pycache__/other.py",
+        "node_modules/pkg/tool.py",
+    ):
+        (tmp_path / relative).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative).write_text("")
+
+    paths = cli._expand_contracts((str(tmp_path),))
+
+    assert paths == [tmp_path / "contract.py", tmp_path / "pkg" / "other.py"]
+
+
+def test_lint_maps_deduplicated_results_back_to_every_path(monkeypatch, tmp_path):
+    original = _write_contract(tmp_path / "a.py", "aaaa")
+    copy = tmp_path / "b.py"
+    copy.write_text(original.read_text())
+    different = tmp_path / "c.py"
+    different.write_text("import random\n" + original.read_text())
+    linted = []
+    lint_contract_cached = cli.lint_contract_cached
+
+    def _spy_lint(path, use_cache=True):
+        linted.append(path)
+        return lint_contract_cached(path, use_cache=use_cache)
+
+    monkeypatch.setattr(cli, "lint_contract_cached", _spy_lint)
+    result = CliRunner().invoke(
+        cli.lint, [str(original), str(copy), str(different), "--json", "--no-cache"]
+    )
+
+    files = json.loads(result.output)["files"]
+    assert [f["path"] for f in files] == [str(original), str(copy), str(different)]
+    assert linted == [original, different]
+    codes = [[w["code"] for w in f.get("warnings", [])] for f in files]
+    assert codes[0] == codes[1]
+    assert "W001" not in codes[0]
+    assert "W001" in codes[2]
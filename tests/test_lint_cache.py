@@ -0,0 +1,176 @@
+"""Unit tests for the on-disk lint result cache."""
+
+import os
+
+from genvm_linter import GenVMLinter
+from genvm_linter.lint import cache, linter
+
+CONTRACT = """\
+# { "Depends": "py-genlayer:test" }
+from genlayer import *
+import random
+
+class MyContract(gl.Contract):
+    def __init__(self):
+        pass
+"""
+
+
+def test_unchanged_contract_is_served_from_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+
+    first = cache.lint_contract_cached(contract)
+
+    def _fail_lint(_path):
+        raise AssertionError("an unchanged contract must not be re-linted")
+
+    monkeypatch.setattr(cache, "lint_contract", _fail_lint)
+    second = cache.lint_contract_cached(contract)
+
+    assert second == first
+    assert any(w["code"] == "W001" for w in second.warnings)
+
+
+def test_unchanged_contract_is_not_read_again(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+    os.utime(contract, (1_000_000, 1_000_000))
+    first = cache.lint_contract_cached(contract)
+
+    def _fail_hash(_source):
+        raise AssertionError("an unchanged contract must be served by mtime and size")
+
+    monkeypatch.setattr(cache, "cache_key", _fail_hash)
+    second = cache.lint_contract_cached(contract)
+
+    assert second == first
+
+
+def test_just_modified_contract_is_read_again(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+    cache.lint_contract_cached(contract)
+    mtime_ns = contract.stat().st_mtime_ns
+
+    # Same size and mtime, as an edit within the mtime granularity could leave it
+    contract.write_text(CONTRACT.replace("random", "hashes"))
+    os.utime(contract, ns=(mtime_ns, mtime_ns))
+    result = cache.lint_contract_cached(contract)
+
+    assert not any(w["code"] == "W001" for w in result.warnings)
+
+
+def test_edited_contract_misses_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+    cache.lint_contract_cached(contract)
+
+    contract.write_text(CONTRACT.replace("import random\n", ""))
+    result = cache.lint_contract_cached(contract)
+
+    assert not any(w["code"] == "W001" for w in result.warnings)
+
+
+def test_rule_changes_miss_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+    cache.lint_contract_cached(contract)
+
+    monkeypatch.setattr(cache, "_rules_fingerprint", lambda: b"edited rules")
+    calls = []
+
+    def _spy_lint(path):
+        calls.append(path)
+        return linter.lint_contract(path)
+
+    monkeypatch.setattr(cache, "lint_contract", _spy_lint)
+    cache.lint_contract_cached(contract)
+
+    assert calls == [contract]
+
+
+def test_no_cache_neither_reads_nor_writes(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+
+    result = cache.lint_contract_cached(contract, use_cache=False)
+
+    assert result == linter.lint_contract(contract)
+    assert not (tmp_path / "lint").exists()
+
+
+def test_genvm_linter_serves_unchanged_file_from_disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+
+    first = GenVMLinter(use_disk_cache=True).lint_file(contract)
+
+    def _fail_lint(*_args):
+        raise AssertionError("an unchanged file must not be re-linted")
+
+    monkeypatch.setattr(GenVMLinter, "lint_source", _fail_lint)
+    second = GenVMLinter(use_disk_cache=True).lint_file(contract)
+
+    assert second == first
+    assert any(r.rule_id == "W001" for r in second)
+
+
+def test_cache_keeps_most_recently_used_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    monkeypatch.setattr(cache, "_LINT_CACHE_LIMIT", 2)
+    for i, key in enumerate(("old", "used", "new")):
+        cache.put(key, {"ok": True, "passed": i})
+        os.utime(cache.CACHE_DIR / f"{key}.json", (i, i))
+    cache.get("used")
+    cache.put("newest", {"ok": True, "passed": 3})
+
+    assert sorted(p.stem for p in cache.CACHE_DIR.iterdir()) == ["newest", "used"]
+
+
+def test_genvm_linter_entries_do_not_share_lint_contract_keys(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path / "lint")
+    contract = tmp_path / "contract.py"
+    contract.write_text(CONTRACT)
+
+    GenVMLinter(use_disk_cache=True).lint_file(contract)
+    cache.lint_contract_cached(contract)
+
+    names = [p.name for p in cache.CACHE_DIR.iterdir()]
+    assert len(names) > 1
+    assert sum(name.startswith("results-") for name in names) == 1
+
+
+def test_genvm_linter_results_can_be_edited_without_touching_the_cache():
+    studio_linter = GenVMLinter()
+    first = studio_linter.lint_source(CONTRACT, "contract.py")
+    first[0].line = 99
+
+    second = studio_linter.lint_source(CONTRACT, "contract.py")
+
+    assert second[0].line != 99
+
+
+def test_genvm_linter_reuses_and_evicts_in_memory_results(monkeypatch):
+    monkeypatch.setattr(GenVMLinter, "_CACHE_MAX", 2)
+    studio_linter = GenVMLinter()
+    linted = []
+    lint_uncached = studio_linter._lint_source
+
+    def _spy_lint(source_code, filename):
+        linted.append(source_code)
+        return lint_uncached(source_code, filename)
+
+    monkeypatch.setattr(studio_linter, "_lint_source", _spy_lint)
+    for source in ("a = 1\n", "b = 1\n", "a = 1\n", "c = 1\n", "b = 1\n", "a = 1\n"):
+        studio_linter.lint_source(source)
+
+    # The hit on "a" keeps it past "c", which evicts "b"; the second "b" evicts "a"
+    assert linted == ["a = 1\n", "b = 1\n", "c = 1\n", "b = 1\n", "a = 1\n"]
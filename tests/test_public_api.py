@@ -0,0 +1,39 @@
+"""Tests for the backwards-compatible studio API."""
+
+import pytest
+
+import genvm_linter
+from genvm_linter import linter, rules
+
+
+def test_validation_result_keeps_instance_dict():
+    result = rules.ValidationResult("W001", "Forbidden import", rules.Severity.WARNING, 3, 0)
+
+    assert vars(result)["rule_id"] == "W001"
+    assert result.__dict__["line"] == 3
+
+
+def _forget_resolved_exports(monkeypatch):
+    """Drop exports cached by earlier imports, so they are resolved lazily again."""
+    for name in genvm_linter._LAZY_EXPORTS:
+        monkeypatch.delitem(vars(genvm_linter), name, raising=False)
+
+
+def test_package_exports_resolve_lazily(monkeypatch):
+    _forget_resolved_exports(monkeypatch)
+
+    from genvm_linter import GenVMLinter, ValidationResult
+
+    assert GenVMLinter is linter.GenVMLinter
+    assert ValidationResult is rules.ValidationResult
+
+
+def test_unknown_package_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        genvm_linter.Missing
+
+
+def test_package_dir_lists_exports(monkeypatch):
+    _forget_resolved_exports(monkeypatch)
+
+    assert set(genvm_linter.__all__) <= set(dir(genvm_linter))
@@ -0,0 +1,29 @@
+"""Tests for the textual prescreen in check_safety."""
+
+from genvm_linter.lint import safety
+from genvm_linter.lint.safety import check_safety
+
+
+def _fail_parse(_source):
+    raise AssertionError("a source with nothing to flag must not be parsed")
+
+
+def test_source_without_trigger_tokens_skips_parsing(monkeypatch):
+    monkeypatch.setattr(safety, "parse_cached", _fail_parse)
+
+    assert check_safety("from genlayer import *\n\nvalue = compute(1)\n") == []
+
+
+def test_source_with_trigger_token_is_analysed():
+    src = "from genlayer import *\n\nresult = gl.nondet.exec_prompt('hi')\n"
+
+    assert safety._QUICK_SCAN.search(src) is not None
+    assert [w.code for w in check_safety(src)] == ["E010"]
+
+
+def test_non_ascii_identifiers_bypass_the_prescreen():
+    # The parser NFKC-normalizes the fullwidth name to "random"
+    src = "import ｒａｎｄｏｍ\n"
+
+    assert safety._QUICK_SCAN.search(src) is None
+    assert [w.code for w in check_safety(src)] == ["W001"]
@@ -316,3 +316,41 @@ def test_generate_stubs_unpacks_extract_sdk_paths(monkeypatch, tmp_path):
         raise AssertionError(f"stub generation still mishandles the tuple: {exc}") from exc
     except Exception:
         pass
+
+
+def test_extract_sdk_paths_is_memoized_per_artifact(monkeypatch, tmp_path):
+    _clear_source_environment(monkeypatch)
+    root = _make_usable_prebuilt_root(tmp_path)
+    genlayer_hash, _std_hash = _write_sdk_runners(root)
+    monkeypatch.setattr(artifacts, "CACHE_DIR", tmp_path / "cache")
+    deps = {"py-genlayer": genlayer_hash}
+
+    first, _notes = sdk_loader.extract_sdk_paths(root, deps)
+
+    def _fail_extract(*args, **kwargs):
+        raise AssertionError("a memoized artifact must not be extracted again")
+
+    monkeypatch.setattr(sdk_loader, "extract_runner", _fail_extract)
+    second, _notes = sdk_loader.extract_sdk_paths(root, deps)
+
+    assert second == first
+    second.clear()
+    assert sdk_loader.extract_sdk_paths(root, deps)[0] == first
+
+
+def test_parse_contract_header_tracks_file_changes(tmp_path):
+    contract = tmp_path / "contract.py"
+    contract.write_text(
+        '# { "Seq": [\n'
+        '#   { "Depends": "py-genlayer:first" }\n'
+        "# ] }\n"
+        'x = "# { \\"Depends\\": \\"py-lib-genlayer-embeddings:body\\" }"\n'
+    )
+
+    deps = sdk_loader.parse_contract_header(contract)
+    assert deps == {"py-genlayer": "first"}
+    deps["py-genlayer"] = "mutated"
+    assert sdk_loader.parse_contract_header(contract) == {"py-genlayer": "first"}
+
+    contract.write_text('# { "Depends": "py-genlayer:second-hash" }\n')
+    assert sdk_loader.parse_contract_header(contract) == {"py-genlayer": "second-hash"}